@@ -20,9 +20,30 @@ import argparse
 import os
 import re
 import sys
+import tomllib
 
-# tomlkit preserves formatting/comments unlike standard toml library
-import tomlkit
+# Matches the PEP 440 ".devN" suffix that Cargo's semver can't represent
+_DEV_SUFFIX = re.compile(r"\.dev\d+$")
+
+
+def _version_line(table):
+    """Match the `version = "..."` line of a TOML table, stopping at the next table header.
+
+    Groups: (everything up to the opening quote, the version, the closing quote).
+    """
+    return re.compile(
+        rf'^(\[{table}\][ \t]*$(?:(?!^\[).)*?^version\s*=\s*")([^"]+)(")',
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+_PROJECT_VERSION = _version_line("project")
+_PACKAGE_VERSION = _version_line("package")
+
+
+def _replace_version(pattern, content, version):
+    """Rewrite only the matched version line so formatting and comments are left untouched"""
+    return pattern.subn(lambda m: m.group(1) + version + m.group(3), content, count=1)
 
 
 def update_cargo_version(project_root, version):
@@ -34,22 +55,22 @@ def update_cargo_version(project_root, version):
         return False
 
     try:
-        # Load Cargo.toml preserving formatting
         with open(cargo_path) as f:
-            data = tomlkit.load(f)
+            content = f.read()
 
         # Ensure the [package] section exists
-        package_section = data.get("package")
-        if not isinstance(package_section, (dict, tomlkit.items.Table)):
+        if not isinstance(tomllib.loads(content).get("package"), dict):
             print(f"Error: '[package]' section not found or invalid in {cargo_path}")
             return False
 
         # Update only the package version field
-        package_section["version"] = version
+        content, replaced = _replace_version(_PACKAGE_VERSION, content, version)
+        if not replaced:
+            print(f"Error: 'version' not found in '[package]' section of {cargo_path}")
+            return False
 
-        # Write back preserving formatting
         with open(cargo_path, "w") as f:
-            f.write(tomlkit.dumps(data))
+            f.write(content)
 
         print(f"Cargo.toml version updated to: {version}")
         return True
@@ -71,9 +92,9 @@ def update_version(version):
         sys.exit(1)
 
     try:
-        # Load the pyproject.toml file preserving formatting
         with open(pyproject_path) as f:
-            data = tomlkit.load(f)
+            content = f.read()
+        data = tomllib.loads(content)
 
         # Show the current version
         current_version = data.get("project", {}).get("version", "unknown")
@@ -84,17 +105,19 @@ def update_version(version):
             print("Error: 'project' section not found in pyproject.toml")
             sys.exit(1)
 
-        data["project"]["version"] = version
+        content, replaced = _replace_version(_PROJECT_VERSION, content, version)
+        if not replaced:
+            print("Error: 'version' not found in '[project]' section of pyproject.toml")
+            sys.exit(1)
 
-        # Write back preserving formatting
         with open(pyproject_path, "w") as f:
-            f.write(tomlkit.dumps(data))
+            f.write(content)
 
         print(f"pyproject.toml version updated to: {version}")
 
         # Also update Cargo.toml with base version (Cargo doesn't support .dev suffixes)
         # Extract base version by stripping any .devN suffix
-        cargo_version = re.sub(r'\.dev\d+$', '', version)
+        cargo_version = _DEV_SUFFIX.sub("", version)
         if not update_cargo_version(project_root, cargo_version):
             print("Error: failed to update Cargo.toml")
             sys.exit(1)
@@ -104,6 +127,33 @@ def update_version(version):
         sys.exit(1)
 
 
+def _base_version_cache_path():
+    """Cache file for --get-base, or None outside GitHub Actions"""
+    runner_temp = os.environ.get("RUNNER_TEMP")
+    return os.path.join(runner_temp, "httpr_ver") if runner_temp else None
+
+
+def _read_cached_base_version(cache_path, stamp):
+    """Return the cached base version if it was computed for this exact pyproject.toml"""
+    try:
+        with open(cache_path) as f:
+            cached_stamp, _, version = f.read().partition(":")
+    except OSError:
+        return None
+    return version if cached_stamp == stamp and version else None
+
+
+def _write_cached_base_version(cache_path, stamp, version):
+    """Write the cache atomically; failing to cache must never fail the job"""
+    tmp_path = f"{cache_path}.{os.getpid()}"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(f"{stamp}:{version}")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def get_base_version():
     """Get the base version from pyproject.toml (without any dev suffix)"""
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -113,12 +163,30 @@ def get_base_version():
         print(f"Error: pyproject.toml not found at {pyproject_path}", file=sys.stderr)
         sys.exit(1)
 
+    # Jobs may ask for the base version several times; reuse the previous answer
+    # while pyproject.toml is unchanged (mtime and size both match)
+    cache_path = _base_version_cache_path()
+    if cache_path:
+        stat = os.stat(pyproject_path)
+        stamp = f"{stat.st_mtime_ns}-{stat.st_size}"
+        cached = _read_cached_base_version(cache_path, stamp)
+        if cached:
+            return cached
+
     try:
         with open(pyproject_path) as f:
-            data = tomlkit.load(f)
-        version = data.get("project", {}).get("version", "0.0.0")
+            content = f.read()
+        # Shell scripts only need this one field, so skip the full TOML parse when
+        # the line is where we expect it
+        match = _PROJECT_VERSION.search(content)
+        if match:
+            version = match.group(2)
+        else:
+            version = tomllib.loads(content).get("project", {}).get("version", "0.0.0")
         # Strip any existing dev suffix to get clean base version
-        base_version = re.sub(r'\.dev\d+$', '', version)
+        base_version = _DEV_SUFFIX.sub("", version)
+        if cache_path:
+            _write_cached_base_version(cache_path, stamp, base_version)
         return base_version
     except Exception as e:
         print(f"Error reading version: {e}", file=sys.stderr)
@@ -1,14 +1,14 @@
 # /// script
-# requires-python = ">=3.10"
+# requires-python = ">=3.11"
 # dependencies = [
 #     "aiohttp",
 #     "curl_cffi",
 #     "httpr",
 #     "httpx",
-#     "pandas",
 #     "pycurl",
 #     "requests",
 #     "tls-client",
+#     "uvloop; sys_platform != 'win32'",
 # ]
 # ///
 """HTTP-client comparison benchmark. Run with: uv run --script benchmark/benchmark.py
@@ -19,27 +19,42 @@ The httpr dependency resolves from the local working tree when invoked through
 
 import argparse
 import asyncio
+import csv
+import multiprocessing
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import partial
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cache, partial
 from importlib.metadata import version
 from io import BytesIO
 
 import aiohttp
 import curl_cffi.requests
 import httpx
-import pandas as pd
 import pycurl
 import requests
 import tls_client
 
 import httpr
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 
 class PycurlSession:
+    __slots__ = ("c", "content", "buffer")
+
     def __init__(self):
         self.c = pycurl.Curl()
         self.content = None
+        # Reused across requests; get() rewinds it instead of allocating a new one
+        self.buffer = BytesIO()
+        # Options that never change are set once; get() only has to set the URL
+        self.c.setopt(pycurl.WRITEDATA, self.buffer)
+        self.c.setopt(pycurl.ENCODING, "gzip")  # Automatically handle gzip encoding
 
     def __del__(self):
         self.close()
@@ -48,12 +63,11 @@ class PycurlSession:
         self.c.close()
 
     def get(self, url):
-        buffer = BytesIO()
+        self.buffer.seek(0)
+        self.buffer.truncate()
         self.c.setopt(pycurl.URL, url)
-        self.c.setopt(pycurl.WRITEDATA, buffer)
-        self.c.setopt(pycurl.ENCODING, "gzip")  # Automatically handle gzip encoding
         self.c.perform()
-        self.content = buffer.getvalue()
+        self.content = self.buffer.getvalue()
         return self
 
     @property
@@ -63,6 +77,9 @@ class PycurlSession:
 
 results = []
 requests_number = 400
+# Async tests keep at most this many requests in flight, so results reflect
+# steady-state throughput rather than a 400-socket burst against loopback
+max_in_flight = 64
 
 PACKAGES = [
     ("requests", requests.Session),
@@ -91,56 +108,131 @@ AsyncPACKAGES = [
 # Optional override for httpr version (set via --httpr-version CLI arg)
 _httpr_version_override: str | None = None
 
+# Whether sync tests decode bodies with `.text` (disable via --no-decode CLI arg
+# to measure raw `.content` throughput without the UTF-8 decode)
+_decode_text = True
+
+# Whether multithread tests run their sessions in worker processes rather than
+# threads (set via --use-processes CLI arg)
+_use_processes = False
+
+
+# PACKAGES and AsyncPACKAGES share most names; look each distribution up only once
+_dist_version = cache(version)
+
 
 def add_package_version(packages):
     def get_version(name):
         if name == "httpr" and _httpr_version_override:
             return _httpr_version_override
-        return version(name)
+        return _dist_version(name)
 
     return [(f"{name} {get_version(name)}", classname) for name, classname in packages]
 
 
-def get_test(session_class, requests_number):
+def get_test(session_class, requests_number, decode=True):
     for _ in range(requests_number):
         s = session_class()
         try:
-            s.get(url).text
+            if decode:
+                s.get(url).text
+            else:
+                s.get(url).content
         finally:
             if hasattr(s, "close"):
                 s.close()
 
 
-def session_get_test(session_class, requests_number, json_response=False):
+def _init_worker(worker_url, barrier):
+    # Worker processes don't inherit the `url` global under spawn/forkserver
+    global url, _warm_up_barrier
+    url = worker_url
+    _warm_up_barrier = barrier
+
+
+def _warm_up():
+    # Each call holds its worker until all of them have started, so submitting one
+    # per worker makes the pool start every worker before the timed region.
+    _warm_up_barrier.wait()
+
+
+def _timed_session_get_test(*args, **kwargs):
+    """Run `session_get_test` and return the CPU time it used in this process."""
+    cpu_start = time.process_time()
+    session_get_test(*args, **kwargs)
+    return time.process_time() - cpu_start
+
+
+def session_get_test(session_class, requests_number, json_response=False, decode=True):
     s = session_class()
     try:
         for _ in range(requests_number):
             if json_response:
                 s.get(url).json()
-            else:
+            elif decode:
                 s.get(url).text
+            else:
+                s.get(url).content
     finally:
         if hasattr(s, "close"):
             s.close()
 
 
 async def async_session_get_test(session_class, requests_number, json_response=False):
+    semaphore = asyncio.Semaphore(max_in_flight)
+
     async def aget(s, url):
-        resp = await s.get(url)
+        async with semaphore:
+            resp = await s.get(url)
         if json_response:
             return resp.json()
         else:
             return resp.text
 
-    async with session_class() as s:
-        tasks = [aget(s, url) for _ in range(requests_number)]
-        await asyncio.gather(*tasks)
+    async with session_class() as s, asyncio.TaskGroup() as tg:
+        for _ in range(requests_number):
+            tg.create_task(aget(s, url))
 
 
 PACKAGES = add_package_version(PACKAGES)
 AsyncPACKAGES = add_package_version(AsyncPACKAGES)
 
 
+def pivot_results(rows, key):
+    """Mean `time`/`cpu_time` per (name, `key`) and size, laid out like a flattened pandas pivot table.
+
+    Returns the column names and one dict per (name, `key`) pair, sorted by name.
+    Sizes a pair was not run with are left out of its dict.
+    """
+    sizes = sorted({row["size"] for row in rows})
+    columns = ["name", key] + [f"{metric} {size}" for metric in ("cpu_time", "time") for size in sizes]
+    cells = defaultdict(lambda: defaultdict(list))
+    for row in rows:
+        group = cells[(row["name"], row[key])]
+        for metric in ("cpu_time", "time"):
+            group[f"{metric} {row['size']}"].append(row[metric])
+    table = [
+        {"name": name, key: value, **{col: sum(v) / len(v) for col, v in group.items()}}
+        for (name, value), group in cells.items()
+    ]
+    table.sort(key=lambda row: row["name"])
+    return columns, table
+
+
+def format_table(columns, table):
+    """Render rows as right-aligned text columns for the console."""
+    cells = [columns] + [[str(row.get(col, "NaN")) for col in columns] for row in table]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    return "\n".join(" ".join(cell.rjust(width) for cell, width in zip(line, widths, strict=True)) for line in cells)
+
+
+def write_csv(file_name, columns, table):
+    with open(file_name, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
+
+
 def run_standard_benchmarks():
     global results, url
 
@@ -153,9 +245,9 @@ def run_standard_benchmarks():
                 start = time.perf_counter()
                 cpu_start = time.process_time()
                 if session:
-                    session_get_test(session_class, requests_number)
+                    session_get_test(session_class, requests_number, decode=_decode_text)
                 else:
-                    get_test(session_class, requests_number)
+                    get_test(session_class, requests_number, decode=_decode_text)
                 dur = round(time.perf_counter() - start, 2)
                 cpu_dur = round(time.process_time() - cpu_start, 2)
                 results.append(
@@ -169,92 +261,99 @@ def run_standard_benchmarks():
                 )
                 print(f"    name: {name:<30} time: {dur} cpu_time: {cpu_dur}")
 
-    # Async tests
-    for response_size in ["5k", "50k", "200k"]:
-        url = f"http://127.0.0.1:8000/{response_size}"
-        print(f"\nThreads=1, session=Async, {response_size=}, {requests_number=}")
-        for name, session_class in AsyncPACKAGES:
-            start = time.perf_counter()
-            cpu_start = time.process_time()
-            asyncio.run(async_session_get_test(session_class, requests_number, json_response=False))
-            dur = round(time.perf_counter() - start, 2)
-            cpu_dur = round(time.process_time() - cpu_start, 2)
-            results.append(
-                {
-                    "name": name,
-                    "session": "Async",
-                    "size": response_size,
-                    "time": dur,
-                    "cpu_time": cpu_dur,
-                }
-            )
-            print(f"    name: {name:<30} time: {dur} cpu_time: {cpu_dur}")
-
-    # JSON endpoints async tests
-    for json_endpoint in ["json/1", "json/10"]:
-        for gzip_param in ["false", "true"]:
-            url = f"http://127.0.0.1:8000/{json_endpoint}?gzip={gzip_param}"
-            print(f"\nThreads=1, session=Async, {json_endpoint=}, gzip={gzip_param}, {requests_number=}")
+    # Async tests. One Runner serves every combination so the event loop is
+    # built once rather than per client and size. Every client runs on the same
+    # (uvloop, where available) loop, so the comparison stays apples-to-apples.
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        for response_size in ["5k", "50k", "200k"]:
+            url = f"http://127.0.0.1:8000/{response_size}"
+            print(f"\nThreads=1, session=Async, {response_size=}, {requests_number=}")
             for name, session_class in AsyncPACKAGES:
                 start = time.perf_counter()
                 cpu_start = time.process_time()
-                asyncio.run(async_session_get_test(session_class, requests_number, json_response=True))
+                runner.run(async_session_get_test(session_class, requests_number, json_response=False))
                 dur = round(time.perf_counter() - start, 2)
                 cpu_dur = round(time.process_time() - cpu_start, 2)
                 results.append(
                     {
                         "name": name,
                         "session": "Async",
-                        "size": f"{json_endpoint}?gzip={gzip_param}",
+                        "size": response_size,
                         "time": dur,
                         "cpu_time": cpu_dur,
                     }
                 )
                 print(f"    name: {name:<30} time: {dur} cpu_time: {cpu_dur}")
 
+        # JSON endpoints async tests
+        for json_endpoint in ["json/1", "json/10"]:
+            for gzip_param in ["false", "true"]:
+                url = f"http://127.0.0.1:8000/{json_endpoint}?gzip={gzip_param}"
+                print(f"\nThreads=1, session=Async, {json_endpoint=}, gzip={gzip_param}, {requests_number=}")
+                for name, session_class in AsyncPACKAGES:
+                    start = time.perf_counter()
+                    cpu_start = time.process_time()
+                    runner.run(async_session_get_test(session_class, requests_number, json_response=True))
+                    dur = round(time.perf_counter() - start, 2)
+                    cpu_dur = round(time.process_time() - cpu_start, 2)
+                    results.append(
+                        {
+                            "name": name,
+                            "session": "Async",
+                            "size": f"{json_endpoint}?gzip={gzip_param}",
+                            "time": dur,
+                            "cpu_time": cpu_dur,
+                        }
+                    )
+                    print(f"    name: {name:<30} time: {dur} cpu_time: {cpu_dur}")
+
     # Create pivot table and export CSV files for sync/async tests
-    df = pd.DataFrame(results)
-    pivot_df = df.pivot_table(
-        index=["name", "session"],
-        columns="size",
-        values=["time", "cpu_time"],
-        aggfunc="mean",
-    )
-    pivot_df.reset_index(inplace=True)
-    pivot_df.columns = [" ".join(col).strip() for col in pivot_df.columns.values]
-    pivot_df = pivot_df[["name", "session"] + [col for col in pivot_df.columns if col not in ["name", "session"]]]
-    print(pivot_df)
+    columns, table = pivot_results(results, "session")
+    print(format_table(columns, table))
     for session in [False, True, "Async"]:
-        session_df = pivot_df[pivot_df["session"] == session]
+        session_table = [row for row in table if row["session"] == session]
         print(f"\nThreads=1 {session=}:")
-        print(session_df.to_string(index=False))
-        session_df.to_csv(f"{session=}.csv", index=False)
+        print(format_table(columns, session_table))
+        write_csv(f"{session=}.csv", columns, session_table)
 
 
 def run_multithread_benchmarks():
     global results, url
 
+    # With processes each worker has its own GIL, so the thread/process delta of
+    # the pure-Python clients is their GIL contention.
+    executor_class = ProcessPoolExecutor if _use_processes else ThreadPoolExecutor
+    barrier_class = multiprocessing.Barrier if _use_processes else threading.Barrier
     threads_numbers = [5, 32]
     for threads_number in threads_numbers:
         for response_size in ["5k", "50k", "200k"]:
             url = f"http://127.0.0.1:8000/{response_size}"
             print(f"\nThreads={threads_number}, session=True, {response_size=}, {requests_number=}")
             for name, session_class in PACKAGES:
-                start = time.perf_counter()
-                cpu_start = time.process_time()
-                with ThreadPoolExecutor(threads_number) as executor:
+                barrier = barrier_class(threads_number)
+                with executor_class(threads_number, initializer=_init_worker, initargs=(url, barrier)) as executor:
+                    # Start (and for processes, import into) every worker outside the timed region
+                    for f in [executor.submit(_warm_up) for _ in range(threads_number)]:
+                        f.result()
+                    start = time.perf_counter()
+                    cpu_start = time.process_time()
                     futures = [
                         executor.submit(
-                            session_get_test,
+                            _timed_session_get_test,
                             session_class,
                             int(requests_number / threads_number),
+                            decode=_decode_text,
                         )
                         for _ in range(threads_number)
                     ]
-                    for f in as_completed(futures):
-                        f.result()
-                dur = round(time.perf_counter() - start, 2)
-                cpu_dur = round(time.process_time() - cpu_start, 2)
+                    worker_cpu = sum(f.result() for f in as_completed(futures))
+                    dur = round(time.perf_counter() - start, 2)
+                    # `process_time` is process-wide: with threads it already covers the
+                    # workers, with processes their own CPU time has to be added.
+                    cpu_dur = time.process_time() - cpu_start
+                    if _use_processes:
+                        cpu_dur += worker_cpu
+                    cpu_dur = round(cpu_dur, 2)
                 results.append(
                     {
                         "name": name,
@@ -266,21 +365,11 @@ def run_multithread_benchmarks():
                 )
                 print(f"    name: {name:<30} time: {dur} cpu_time: {cpu_dur}")
 
-    df = pd.DataFrame(results)
-    pivot_df = df.pivot_table(
-        index=["name", "threads"],
-        columns="size",
-        values=["time", "cpu_time"],
-        aggfunc="mean",
-    )
-    pivot_df.reset_index(inplace=True)
-    pivot_df.columns = [" ".join(col).strip() for col in pivot_df.columns.values]
-    pivot_df = pivot_df[["name", "threads"] + [col for col in pivot_df.columns if col not in ["name", "threads"]]]
-    unique_threads = pivot_df["threads"].unique()
-    for thread in unique_threads:
-        thread_df = pivot_df[pivot_df["threads"] == thread]
+    columns, table = pivot_results(results, "threads")
+    for thread in sorted({row["threads"] for row in table}):
+        thread_table = [row for row in table if row["threads"] == thread]
         print(f"\nThreads={thread} session=True")
-        print(thread_df.to_string(index=False))
+        print(format_table(columns, thread_table))
 
 
 if __name__ == "__main__":
@@ -297,10 +386,24 @@ if __name__ == "__main__":
         default=None,
         help="Override httpr version in benchmark output (e.g., 0.3.0)",
     )
+    parser.add_argument(
+        "--no-decode",
+        action="store_true",
+        default=False,
+        help="If provided, sync tests read raw `.content` instead of decoding `.text`",
+    )
+    parser.add_argument(
+        "--use-processes",
+        action="store_true",
+        default=False,
+        help="If provided, run the multithreading tests in worker processes instead of threads",
+    )
     args = parser.parse_args()
 
     if args.httpr_version:
         _httpr_version_override = args.httpr_version
+    _decode_text = not args.no_decode
+    _use_processes = args.use_processes
 
     if args.run_multithread:
         run_multithread_benchmarks()
@@ -1,116 +1,240 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
-#     "cbor2",
-#     "starlette",
-#     "uvicorn",
+#     "isal",
+#     "numpy",
+#     "orjson",
+#     "uvicorn[standard]",
 # ]
 # ///
 """Benchmark target server. Run with: uv run --script benchmark/server.py"""
 
 import base64
-import gzip
-import json
 import os
-import random  # used to generate random floats
 
-import cbor2
-from starlette.applications import Starlette
-from starlette.responses import Response
-from starlette.routing import Route
+import numpy as np
+import orjson
+
+# One level on either backend, so the gzipped payloads (and the work of decoding
+# them) stay comparable wherever the server runs. 3 is the highest ISA-L has.
+GZIP_LEVEL = 3
+
+try:
+    # ISA-L writes the same gzip format several times faster than zlib, which
+    # shortens the startup precomputation.
+    from isal import igzip as gzip
+
+    GZIP_BACKEND = "isal"
+except ImportError:  # no wheel for this platform
+    import gzip
+
+    GZIP_BACKEND = "zlib"
+
+
+def gzip_compress(data):
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
 
 random_5k = base64.b64encode(os.urandom(5 * 1024)).decode("utf-8")
-random_5k = gzip.compress(random_5k.encode("utf-8"))
+random_5k = gzip_compress(random_5k.encode("utf-8"))
 
 random_50k = base64.b64encode(os.urandom(50 * 1024)).decode("utf-8")
-random_50k = gzip.compress(random_50k.encode("utf-8"))
+random_50k = gzip_compress(random_50k.encode("utf-8"))
 
 random_200k = base64.b64encode(os.urandom(200 * 1024)).decode("utf-8")
-random_200k = gzip.compress(random_200k.encode("utf-8"))
+random_200k = gzip_compress(random_200k.encode("utf-8"))
+
+
+class StaticResponse:
+    """ASGI app that replays one precomputed response.
+
+    Both ASGI messages are built once, so serving a request is just two `send`
+    calls -- none of the per-call header handling of Starlette's `Response`.
+    """
+
+    def __init__(self, body, headers, status=200):
+        raw_headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        self.start_message = {"type": "http.response.start", "status": status, "headers": raw_headers}
+        self.body_message = {"type": "http.response.body", "body": body}
+
+    async def __call__(self, scope, receive, send):
+        await send(self.start_message)
+        await send(self.body_message)
+
+
+def wants_gzip(query_string):
+    """Whether the raw query string carries a truthy `gzip` parameter.
+
+    Scans the bytes directly instead of building a parsed query multidict for
+    the one flag the benchmark routes care about.
+    """
+    for pair in query_string.split(b"&"):
+        if pair.startswith(b"gzip="):
+            return pair[5:].lower() in (b"true", b"1", b"yes")
+    return False
 
 
 def gzip_response(gzipped_content):
-    headers = {
-        "Content-Encoding": "gzip",
-        "Content-Length": str(len(gzipped_content)),
-    }
-    return Response(gzipped_content, headers=headers)
+    return StaticResponse(gzipped_content, {"Content-Encoding": "gzip"})
+
+
+# The random payloads are gzipped once at startup and every request is served
+# the same response, like the precomputed JSON/CBOR ones below; `?gzip=` makes
+# no difference for them.
+response_5k = (gzip_response(random_5k),) * 2
+response_50k = (gzip_response(random_50k),) * 2
+response_200k = (gzip_response(random_200k),) * 2
 
 
 def json_response_body(data):
-    # Return the JSON body encoded as bytes without compression.
-    return json.dumps(data).encode("utf-8")
+    # Return the JSON body encoded as bytes without compression. orjson
+    # serializes the float64 ndarray directly, without boxing each element.
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def make_precomputed(body, media_type):
+    """Precompute `(plain, gzipped)` responses for `body`, indexed by `wants_gzip`."""
+    resp_plain = StaticResponse(body, {"Content-Type": media_type})
+    resp_gzip = StaticResponse(gzip_compress(body), {"Content-Encoding": "gzip", "Content-Type": media_type})
+    return resp_plain, resp_gzip
 
 
 def make_precomputed_json(data):
     # Precompute both non-gzipped and gzipped responses.
-    body = json_response_body(data)
-    resp_plain = Response(body, headers={"Content-Type": "application/json"})
-    gzipped_body = gzip.compress(body)
-    headers = {
-        "Content-Encoding": "gzip",
-        "Content-Length": str(len(gzipped_body)),
-        "Content-Type": "application/json",
-    }
-    resp_gzip = Response(gzipped_body, headers=headers)
-    return resp_plain, resp_gzip
+    return make_precomputed(json_response_body(data), "application/json")
 
 
-def make_precomputed_cbor(data):
-    """Precompute CBOR responses (with and without gzip)."""
-    body = cbor2.dumps(data)
-    resp_plain = Response(body, headers={"Content-Type": "application/cbor"})
-    gzipped_body = gzip.compress(body)
-    headers = {
-        "Content-Encoding": "gzip",
-        "Content-Length": str(len(gzipped_body)),
-        "Content-Type": "application/cbor",
-    }
-    resp_gzip = Response(gzipped_body, headers=headers)
-    return resp_plain, resp_gzip
+def cbor_head(major_type, length):
+    """CBOR initial byte plus length argument (RFC 8949, section 3)."""
+    if length < 24:
+        return bytes([major_type << 5 | length])
+    if length < 0x100:
+        return bytes([major_type << 5 | 24, length])
+    if length < 0x10000:
+        return bytes([major_type << 5 | 25]) + length.to_bytes(2, "big")
+    return bytes([major_type << 5 | 26]) + length.to_bytes(4, "big")
+
 
+def cbor_float_matrix(data):
+    """Encode a 2-D float64 array as a CBOR array of arrays of doubles.
 
-# Precompute JSON payloads.
+    Byte-for-byte what `cbor2.dumps(data.tolist())` produces, but each row is
+    laid out by NumPy as (0xfb, big-endian float64) records instead of being
+    encoded one Python float at a time.
+    """
+    rows, cols = data.shape
+    items = np.empty((rows, cols), dtype=[("head", "u1"), ("value", ">f8")])
+    items["head"] = 0xFB  # major type 7, 64-bit float
+    items["value"] = data
+    row_head = cbor_head(4, cols)
+    return cbor_head(4, rows) + b"".join(row_head + row.tobytes() for row in items)
+
+
+def make_precomputed_cbor(data):
+    """Precompute CBOR responses (with and without gzip)."""
+    return make_precomputed(cbor_float_matrix(data), "application/cbor")
+
+
+def cbor_typed_float_matrix(data):
+    """Encode a 2-D float64 array as an RFC 8746 tagged typed array.
+
+    The matrix is a multi-dimensional array (tag 40) of `[rows, cols]` and one
+    float64 little-endian typed array (tag 86): 8 bytes per value and a single
+    buffer copy, with no per-element head or decimal formatting.
+    """
+    rows, cols = data.shape
+    raw = data.astype("<f8").tobytes()
+    return b"".join(
+        (
+            b"\xd8\x28",  # tag 40, row-major multi-dimensional array
+            cbor_head(4, 2),  # [dimensions, elements]
+            cbor_head(4, 2) + cbor_head(0, rows) + cbor_head(0, cols),
+            b"\xd8\x56",  # tag 86, float64 little-endian typed array
+            cbor_head(2, len(raw)),
+            raw,
+        )
+    )
+
+
+def make_precomputed_f64(data):
+    """Precompute typed-array CBOR responses (with and without gzip)."""
+    return make_precomputed(cbor_typed_float_matrix(data), "application/cbor")
+
+
+# Precompute JSON and CBOR payloads. A fixed seed gives every run (and every
+# worker process) the same matrices, so results are comparable across runs.
+rng = np.random.default_rng(int(os.environ.get("BENCHMARK_SEED", "0")))
 json_precomputed = {}
 cbor_precomputed = {}
+f64_precomputed = {}
 for count in (1, 10, 100):
-    data = [[random.random() for _ in range(1024)] for _ in range(count)]
+    data = rng.random((count, 1024))
     json_precomputed[count] = make_precomputed_json(data)
     cbor_precomputed[count] = make_precomputed_cbor(data)
+    f64_precomputed[count] = make_precomputed_f64(data)
 
 
-def precomputed_json_route(count, request):
-    # Determine if the response should be gzipped
-    use_gzip = request.query_params.get("gzip", "false").lower() in ("true", "1", "yes")
-    # Return the precomputed response: index 1 is gzipped; index 0 isn't.
-    return json_precomputed[count][1] if use_gzip else json_precomputed[count][0]
-
-
-def precomputed_cbor_route(count, request):
-    """Return precomputed CBOR response."""
-    use_gzip = request.query_params.get("gzip", "false").lower() in ("true", "1", "yes")
-    return cbor_precomputed[count][1] if use_gzip else cbor_precomputed[count][0]
-
-
-routes = [
-    Route("/5k", lambda r: gzip_response(random_5k)),
-    Route("/50k", lambda r: gzip_response(random_50k)),
-    Route("/200k", lambda r: gzip_response(random_200k)),
+# Every path is static, so routing is one dict lookup rather than a scan over
+# compiled route regexes. Each path maps to its `(plain, gzipped)` responses and
+# the gzip flag indexes that pair directly.
+routes = {
+    "/5k": response_5k,
+    "/50k": response_50k,
+    "/200k": response_200k,
     # JSON endpoints using precomputed responses:
-    Route("/json/1", lambda request: precomputed_json_route(1, request)),
-    Route("/json/10", lambda request: precomputed_json_route(10, request)),
-    Route("/json/100", lambda request: precomputed_json_route(100, request)),
+    "/json/1": json_precomputed[1],
+    "/json/10": json_precomputed[10],
+    "/json/100": json_precomputed[100],
     # CBOR endpoints using precomputed responses:
-    Route("/cbor/1", lambda request: precomputed_cbor_route(1, request)),
-    Route("/cbor/10", lambda request: precomputed_cbor_route(10, request)),
-    Route("/cbor/100", lambda request: precomputed_cbor_route(100, request)),
-]
+    "/cbor/1": cbor_precomputed[1],
+    "/cbor/10": cbor_precomputed[10],
+    "/cbor/100": cbor_precomputed[100],
+    # Typed-array CBOR endpoints (raw float64 buffers) using precomputed responses:
+    "/f64/1": f64_precomputed[1],
+    "/f64/10": f64_precomputed[10],
+    "/f64/100": f64_precomputed[100],
+}
+
+not_found = (StaticResponse(b"Not Found", {"Content-Type": "text/plain"}, status=404),) * 2
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "http":
+        response = routes.get(scope["path"], not_found)[wants_gzip(scope["query_string"])]
+        await response(scope, receive, send)
+    elif scope["type"] == "lifespan":
+        # Nothing to set up or tear down; just acknowledge the server's messages.
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
 
-app = Starlette(routes=routes)
 
 if __name__ == "__main__":
     import uvicorn
 
     host = os.environ.get("BENCHMARK_HOST", "127.0.0.1")
     port = int(os.environ.get("BENCHMARK_PORT", "8000"))
-    uvicorn.run(app, host=host, port=port)
+    # The benchmark client usually shares the machine, so one worker by default.
+    workers = int(os.environ.get("BENCHMARK_WORKERS", "1"))
+    print(f"gzip payloads: {GZIP_BACKEND}, level {GZIP_LEVEL}")
+    uvicorn.run(
+        # Extra workers import the app themselves; a single one reuses this module's
+        # instead of importing (and precomputing) everything a second time.
+        "server:app" if workers > 1 else app,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host=host,
+        port=port,
+        workers=workers,
+        # uvicorn[standard] provides uvloop and httptools; "auto" selects them
+        # (and falls back to asyncio/h11 where uvloop is unavailable, i.e. Windows).
+        loop="auto",
+        http="auto",
+        # Don't format a log line for every request the benchmark sends.
+        access_log=False,
+        log_level="warning",
+    )
@@ -28,18 +28,13 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
-from collections.abc import AsyncIterator, Generator
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import asynccontextmanager, contextmanager
-from functools import partial
-from typing import TYPE_CHECKING, TypedDict
-
-if sys.version_info <= (3, 11):
-    from typing_extensions import Unpack
-else:
-    from typing import Unpack
-
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 from .httpr import CaseInsensitiveHeaderMap, RClient, Response, StreamingResponse
 
@@ -47,12 +42,28 @@ from .httpr import CaseInsensitiveHeaderMap, RClient, Response, StreamingRespons
 #: created lazily, so an idle client costs nothing.
 DEFAULT_MAX_CONCURRENCY = 64
 
+# Guards the lazy creation of each Client's `request_many` thread pool.
+_executor_lock = threading.Lock()
+
+
+_MISSING = object()
+
 
 class CaseInsensitiveDict(dict[str, str]):
-    """A dict subclass that provides case-insensitive key access."""
+    """A dict subclass that provides case-insensitive key access.
+
+    Keys written through item assignment, `update()` and `setdefault()` are
+    lowercased; keys passed to the constructor are kept as given. Lookups try
+    the key as given first, so that no `str.lower()` call is needed when the
+    caller already uses the stored spelling, and only fall back to the
+    lowercased key on a miss.
+    """
 
     def __getitem__(self, key: str) -> str:
-        return super().__getitem__(key.lower())
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return super().__getitem__(key.lower())
+        return value  # type: ignore[return-value]
 
     def __setitem__(self, key: str, value: str) -> None:
         super().__setitem__(key.lower(), value)
@@ -63,10 +74,13 @@ class CaseInsensitiveDict(dict[str, str]):
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, str):
             return False
-        return super().__contains__(key.lower())
+        return super().__contains__(key) or super().__contains__(key.lower())
 
     def get(self, key: str, default: str | None = None) -> str | None:  # type: ignore[override]
-        return super().get(key.lower(), default)
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return super().get(key.lower(), default)
+        return value  # type: ignore[return-value]
 
     def pop(self, key: str, *args: str) -> str:  # type: ignore[override]
         return super().pop(key.lower(), *args)
@@ -76,72 +90,76 @@ class CaseInsensitiveDict(dict[str, str]):
 
     def update(self, other: dict[str, str] | None = None, **kwargs: str) -> None:  # type: ignore[override]
         if other is not None:
-            super().update({k.lower(): v for k, v in other.items()})
+            # Already-lowercase keys (the usual case) are merged in one C-level call.
+            if all(map(str.islower, other)):
+                super().update(other)
+            else:
+                super().update({k.lower(): v for k, v in other.items()})
         if kwargs:
             super().update({k.lower(): v for k, v in kwargs.items()})
 
 
 class _ClientHeaders(CaseInsensitiveDict):
-    """Case-insensitive headers view that writes changes back to the client."""
+    """Case-insensitive headers view that writes changes back to the client.
+
+    Changes go through `RClient` directly: `Client.set_header`/`del_header` drop
+    the client's cached view, which must not happen for the view's own writes.
+    """
 
     def __init__(self, client: RClient, data: dict[str, str]) -> None:
         self._client = client
         super().__init__(data)
 
     def __setitem__(self, key: str, value: str) -> None:
+        # Rust first: it rejects invalid names/values, and the view must not keep one.
+        RClient.set_header(self._client, key, value)
         super().__setitem__(key, value)
-        self._client.set_header(key, value)
 
     def __delitem__(self, key: str) -> None:
         super().__delitem__(key)
-        self._client.del_header(key)
+        RClient.del_header(self._client, key)
 
     def pop(self, key: str, *args: str) -> str:  # type: ignore[override]
         existed = key in self
         result = super().pop(key, *args)
         if existed:
-            self._client.del_header(key)
+            RClient.del_header(self._client, key)
         return result
 
     def popitem(self) -> tuple[str, str]:
         key, value = super().popitem()
-        self._client.del_header(key)
+        RClient.del_header(self._client, key)
         return key, value
 
     def setdefault(self, key: str, default: str | None = None) -> str | None:  # type: ignore[override]
-        existed = key in self
-        result = super().setdefault(key, default)
-        if not existed and result is not None:
-            self._client.set_header(key, result)
-        return result
+        if key in self:
+            return self[key]
+        if default is not None:
+            self[key] = default
+        return default
 
     def update(self, other: dict[str, str] | None = None, **kwargs: str) -> None:  # type: ignore[override]
-        other = dict(other) if other is not None else None
-        super().update(other, **kwargs)
-        if other:
-            for k, v in other.items():
-                self._client.set_header(k, v)
-        for k, v in kwargs.items():
-            self._client.set_header(k, v)
+        items = dict(other) if other is not None else {}
+        items.update(kwargs)
+        for k, v in items.items():
+            self[k] = v
 
     def clear(self) -> None:
         keys = list(self.keys())
         super().clear()
         for k in keys:
-            self._client.del_header(k)
+            RClient.del_header(self._client, k)
 
 
+# Annotations are never evaluated at runtime (`from __future__ import annotations`),
+# so these names only need to exist for type checkers.
 if TYPE_CHECKING:
-    from .httpr import ClientRequestParams, HttpMethod, RequestParams
-else:
-
-    class _Unpack:
-        @staticmethod
-        def __getitem__(*args, **kwargs):
-            pass
+    if sys.version_info >= (3, 11):
+        from typing import Unpack
+    else:
+        from typing_extensions import Unpack
 
-    Unpack = _Unpack()
-    RequestParams = ClientRequestParams = TypedDict
+    from .httpr import ClientRequestParams, HttpMethod, RequestParams
 
 
 class Client(RClient):
@@ -190,6 +208,10 @@ class Client(RClient):
         proxy: Proxy URL for requests.
     """
 
+    # No per-instance __dict__; all state lives on the Rust side apart from the
+    # cached `headers` view and the thread pool behind `request_many`.
+    __slots__ = ("__weakref__", "_headers_view", "_executor")
+
     def __init__(
         self,
         auth: tuple[str, str | None] | None = None,
@@ -272,6 +294,9 @@ class Client(RClient):
             ```
         """
         super().__init__()
+        self._headers_view: _ClientHeaders | None = None
+        # Created by the first `request_many` call and shut down by `close()`.
+        self._executor: ThreadPoolExecutor | None = None
 
     def __enter__(self) -> Client:
         """Enter context manager."""
@@ -279,12 +304,17 @@ class Client(RClient):
 
     def __exit__(self, *args):
         """Exit context manager and close client."""
-        del self
+        self.close()
 
     def close(self) -> None:
         """
         Close the client and release resources.
 
+        Drops the connection pool and cookie store, and releases the threads
+        started by `request_many`. Requests already in flight finish normally; a
+        request made after `close()` reopens the client with the settings it was
+        created with. Calling `close()` more than once is a no-op.
+
         Example:
             ```python
             client = httpr.Client()
@@ -294,7 +324,11 @@ class Client(RClient):
                 client.close()
             ```
         """
-        del self
+        super().close()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # Idle threads exit now and ones still running a request exit after it.
+            executor.shutdown(wait=False)
 
     @property
     def headers(self) -> dict[str, str]:
@@ -303,11 +337,25 @@ class Client(RClient):
         Mutating the returned mapping in place (e.g. ``client.headers["Accept"] =
         "application/json"``) updates the client. Cookies are never affected.
         """
-        return _ClientHeaders(self, super().headers)
+        # Built once and kept in step by its own mutators, so repeated reads don't
+        # copy every header out of Rust again.
+        view = self._headers_view
+        if view is None:
+            view = self._headers_view = _ClientHeaders(self, super().headers)
+        return view
 
     @headers.setter
     def headers(self, value: dict[str, str] | None) -> None:
         RClient.headers.__set__(self, value)  # type: ignore[attr-defined]
+        self._headers_view = None
+
+    def set_header(self, key: str, value: str) -> None:
+        super().set_header(key, value)
+        self._headers_view = None
+
+    def del_header(self, key: str) -> None:
+        super().del_header(key)
+        self._headers_view = None
 
     def request(
         self,
@@ -330,7 +378,8 @@ class Client(RClient):
             auth (Optional[tuple[str, Optional[str]]]): Basic auth credentials (overrides client default).
             auth_bearer (Optional[str]): Bearer token (overrides client default).
             timeout (Optional[float]): Request timeout in seconds (overrides client default).
-            content (Optional[bytes]): Raw bytes for request body.
+            content (Optional[bytes | Iterable[bytes]]): Raw bytes for request body, or an
+                iterable of bytes chunks that is streamed without being joined first.
             data (Optional[dict[str, Any]]): Form data for request body (application/x-www-form-urlencoded).
             json (Optional[Any]): JSON data for request body (application/json).
             files (Optional[dict[str, str]]): Files for multipart upload (dict mapping field names to file paths).
@@ -351,12 +400,8 @@ class Client(RClient):
         Note:
             Only one of `content`, `data`, `json`, or `files` can be specified per request.
         """
-        if method not in ["GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"]:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        if "params" in kwargs and kwargs["params"] is not None:
-            kwargs["params"] = {k: str(v) for k, v in kwargs["params"].items()}
-
-        return super().request(method=method, url=url, **kwargs)
+        # The method check and params conversion happen in Rust.
+        return super().request(method, url, **kwargs)
 
     def get(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -379,7 +424,7 @@ class Client(RClient):
             print(response.json())
             ```
         """
-        return self.request(method="GET", url=url, **kwargs)
+        return self.request("GET", url, **kwargs)
 
     def head(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -400,7 +445,7 @@ class Client(RClient):
             print(response.headers["content-length"])
             ```
         """
-        return self.request(method="HEAD", url=url, **kwargs)
+        return self.request("HEAD", url, **kwargs)
 
     def options(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -419,7 +464,7 @@ class Client(RClient):
             print(response.headers.get("allow"))
             ```
         """
-        return self.request(method="OPTIONS", url=url, **kwargs)
+        return self.request("OPTIONS", url, **kwargs)
 
     def delete(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -438,7 +483,7 @@ class Client(RClient):
             print(response.status_code)
             ```
         """
-        return self.request(method="DELETE", url=url, **kwargs)
+        return self.request("DELETE", url, **kwargs)
 
     def post(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -455,7 +500,7 @@ class Client(RClient):
             auth (Optional[tuple[str, Optional[str]]]): Basic auth credentials.
             auth_bearer (Optional[str]): Bearer token.
             timeout (Optional[float]): Request timeout.
-            content (Optional[bytes]): Raw bytes body.
+            content (Optional[bytes | Iterable[bytes]]): Raw bytes body, or bytes chunks to stream.
             data (Optional[dict[str, Any]]): Form-encoded body.
             json (Optional[Any]): JSON body.
             files (Optional[dict[str, str]]): Multipart file uploads.
@@ -484,7 +529,7 @@ class Client(RClient):
             )
             ```
         """
-        return self.request(method="POST", url=url, **kwargs)
+        return self.request("POST", url, **kwargs)
 
     def put(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -505,7 +550,7 @@ class Client(RClient):
             )
             ```
         """
-        return self.request(method="PUT", url=url, **kwargs)
+        return self.request("PUT", url, **kwargs)
 
     def patch(self, url: str, **kwargs: Unpack[RequestParams]) -> Response:
         """
@@ -526,28 +571,27 @@ class Client(RClient):
             )
             ```
         """
-        return self.request(method="PATCH", url=url, **kwargs)
+        return self.request("PATCH", url, **kwargs)
 
-    @contextmanager
     def stream(
         self,
         method: HttpMethod,
         url: str,
         **kwargs: Unpack[RequestParams],
-    ) -> Generator[StreamingResponse, None, None]:
+    ) -> StreamingResponse:
         """
         Make a streaming HTTP request.
 
-        Returns a context manager that yields a StreamingResponse for iterating
-        over the response body in chunks without buffering the entire response
-        in memory.
+        Sends the request and returns a StreamingResponse for iterating over the
+        response body in chunks without buffering the entire response in memory.
+        The response is its own context manager and closes itself on exit.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS).
             url: Request URL.
             **kwargs: Request parameters (same as request()).
 
-        Yields:
+        Returns:
             StreamingResponse: A response object that can be iterated to receive chunks.
 
         Example:
@@ -586,19 +630,94 @@ class Client(RClient):
             ```
 
         Note:
-            The response body is only read when you iterate over it or call read().
-            Always use this as a context manager to ensure proper cleanup.
+            The request is sent, and its status and headers received, when
+            `stream()` is called, not when the `with` block is entered. Only the
+            body is read lazily, as you iterate over it or call read(). Always use
+            the response as a context manager (or call close()) so the connection
+            is released.
         """
-        if method not in ["GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"]:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        if "params" in kwargs and kwargs["params"] is not None:
-            kwargs["params"] = {k: str(v) for k, v in kwargs["params"].items()}
+        return super()._stream(method, url, **kwargs)
+
+    def _request_many_executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with _executor_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=DEFAULT_MAX_CONCURRENCY, thread_name_prefix="httpr"
+                    )
+        return executor
+
+    def request_many(
+        self,
+        method: HttpMethod,
+        requests: Iterable[str | tuple[str, RequestParams]],
+        **kwargs: Unpack[RequestParams],
+    ) -> Iterator[tuple[int, Response]]:
+        """
+        Make many requests concurrently, yielding responses as they complete.
+
+        The requests run on a pool of up to `DEFAULT_MAX_CONCURRENCY` threads,
+        created on first use and released by `close()`, all sharing this
+        client's connection pool, so the batch needs no event loop and no thread
+        pool of your own. Nothing is sent until iteration starts.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS).
+            requests: Request URLs, or ``(url, kwargs)`` pairs whose kwargs are
+                merged over the shared ones for that request.
+            **kwargs: Request parameters applied to every request (same as request()).
+
+        Yields:
+            ``(index, response)`` pairs in completion order, where `index` is the
+            request's position in `requests`.
 
-        response = super()._stream(method=method, url=url, **kwargs)
+        Raises:
+            Exception: The exception of the first request to fail. Requests that
+                haven't started by then are cancelled, and ones already running
+                are waited for, as they are when the loop is left early.
+
+        Example:
+            ```python
+            urls = [f"https://httpbin.org/anything/{i}" for i in range(100)]
+            for index, response in client.request_many("GET", urls):
+                print(urls[index], response.status_code)
+
+            # Per-request parameters
+            requests = [("https://httpbin.org/post", {"json": {"id": i}}) for i in range(10)]
+            responses = dict(client.request_many("POST", requests, timeout=10))
+            ```
+        """
+        executor = self._request_many_executor()
+        futures = [
+            executor.submit(_send_indexed, self, method, index, request, kwargs)
+            for index, request in enumerate(requests)
+        ]
         try:
-            yield response
+            for future in as_completed(futures):
+                yield future.result()
         finally:
-            response.close()
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+
+def _send_indexed(
+    client: RClient,
+    method: HttpMethod,
+    index: int,
+    request: str | tuple[str, RequestParams],
+    kwargs: RequestParams,
+) -> tuple[int, Response]:
+    """Send one `request_many` item, merging its own kwargs over the shared ones."""
+    # RClient.request directly: AsyncClient overrides `request` with a coroutine.
+    if isinstance(request, str):
+        return index, RClient.request(client, method, request, **kwargs)
+    url, request_kwargs = request
+    merged = kwargs.copy()
+    merged.update(request_kwargs)
+    return index, RClient.request(client, method, url, **merged)
 
 
 class AsyncClient(Client):
@@ -650,6 +769,8 @@ class AsyncClient(Client):
         caps how many requests can be in flight at once.
     """
 
+    __slots__ = ("max_concurrency",)
+
     def __new__(cls, *args, max_concurrency: int | None = None, **kwargs):
         # Client inherits from the Rust-backed RClient, whose __new__ consumes the
         # constructor keyword arguments, so max_concurrency has to be stripped here
@@ -678,9 +799,8 @@ class AsyncClient(Client):
         """
         super().__init__(*args, **kwargs)
         self.max_concurrency = max_concurrency
-        # Threads are created on demand, and ThreadPoolExecutor retires them via a
-        # weakref callback once this client is collected, so there is nothing to
-        # release explicitly and `aclose` stays the no-op it has always been.
+        # Threads are created on demand and released by `close()`/`aclose()`, or
+        # by ThreadPoolExecutor's weakref callback once this client is collected.
         self._executor = (
             None
             if max_concurrency is None
@@ -693,12 +813,23 @@ class AsyncClient(Client):
 
     async def __aexit__(self, *args):
         """Exit async context manager and close client."""
-        del self
+        await self.aclose()
 
-    async def aclose(self):
+    def close(self) -> None:
+        """Close the client, its connection pool and its thread pool (see `Client.close`)."""
+        super().close()
+        if self.max_concurrency is not None:
+            # The replacement pool only starts threads if the client is used again.
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="httpr")
+
+    async def aclose(self) -> None:
         """
         Close the async client.
 
+        Drops the connection pool and releases this client's threads. Requests
+        already in flight finish normally; a request made afterwards reopens the
+        client (see `Client.close`).
+
         Example:
             ```python
             client = httpr.AsyncClient()
@@ -708,13 +839,13 @@ class AsyncClient(Client):
                 await client.aclose()
             ```
         """
-        del self
-        return
+        self.close()
 
     async def _run_sync_asyncio(self, fn, *args, **kwargs):
         """Run a synchronous function on this client's executor."""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+        # A closure is cheaper to build and call than a functools.partial here.
+        return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
 
     async def request(  # type: ignore[override]
         self,
@@ -738,12 +869,7 @@ class AsyncClient(Client):
             response = await client.request("GET", "https://httpbin.org/get")
             ```
         """
-        if method not in ["GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"]:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        if "params" in kwargs and kwargs["params"] is not None:
-            kwargs["params"] = {k: str(v) for k, v in kwargs["params"].items()}
-
-        return await self._run_sync_asyncio(super().request, method=method, url=url, **kwargs)
+        return await self._run_sync_asyncio(super().request, method, url, **kwargs)
 
     async def get(  # type: ignore[override]
         self,
@@ -765,7 +891,7 @@ class AsyncClient(Client):
             response = await client.get("https://httpbin.org/get")
             ```
         """
-        return await self.request(method="GET", url=url, **kwargs)
+        return await self.request("GET", url, **kwargs)
 
     async def head(  # type: ignore[override]
         self,
@@ -782,7 +908,7 @@ class AsyncClient(Client):
         Returns:
             Response object.
         """
-        return await self.request(method="HEAD", url=url, **kwargs)
+        return await self.request("HEAD", url, **kwargs)
 
     async def options(  # type: ignore[override]
         self,
@@ -799,7 +925,7 @@ class AsyncClient(Client):
         Returns:
             Response object.
         """
-        return await self.request(method="OPTIONS", url=url, **kwargs)
+        return await self.request("OPTIONS", url, **kwargs)
 
     async def delete(  # type: ignore[override]
         self,
@@ -816,7 +942,7 @@ class AsyncClient(Client):
         Returns:
             Response object.
         """
-        return await self.request(method="DELETE", url=url, **kwargs)
+        return await self.request("DELETE", url, **kwargs)
 
     async def post(  # type: ignore[override]
         self,
@@ -841,7 +967,7 @@ class AsyncClient(Client):
             )
             ```
         """
-        return await self.request(method="POST", url=url, **kwargs)
+        return await self.request("POST", url, **kwargs)
 
     async def put(  # type: ignore[override]
         self,
@@ -858,7 +984,7 @@ class AsyncClient(Client):
         Returns:
             Response object.
         """
-        return await self.request(method="PUT", url=url, **kwargs)
+        return await self.request("PUT", url, **kwargs)
 
     async def patch(  # type: ignore[override]
         self,
@@ -875,7 +1001,7 @@ class AsyncClient(Client):
         Returns:
             Response object.
         """
-        return await self.request(method="PATCH", url=url, **kwargs)
+        return await self.request("PATCH", url, **kwargs)
 
     @asynccontextmanager
     async def stream(  # type: ignore[override]
@@ -910,18 +1036,120 @@ class AsyncClient(Client):
             iter_lines). The async part is initiating the request and entering
             the context manager.
         """
-        if method not in ["GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"]:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        if "params" in kwargs and kwargs["params"] is not None:
-            kwargs["params"] = {k: str(v) for k, v in kwargs["params"].items()}
-
         # Run the sync _stream in executor
-        response = await self._run_sync_asyncio(super(Client, self)._stream, method=method, url=url, **kwargs)
+        response = await self._run_sync_asyncio(super(Client, self)._stream, method, url, **kwargs)
         try:
             yield response
         finally:
             response.close()
 
+    async def request_many(  # type: ignore[override]
+        self,
+        method: HttpMethod,
+        requests: Iterable[str | tuple[str, RequestParams]],
+        **kwargs: Unpack[RequestParams],
+    ) -> AsyncIterator[tuple[int, Response]]:
+        """
+        Make many requests concurrently, yielding responses as they complete.
+
+        All requests are submitted to this client's thread pool when iteration
+        starts, so at most `max_concurrency` are in flight at once (with
+        ``max_concurrency=None``, the default executor's ``min(32, cpu_count + 4)``).
+
+        Args:
+            method: HTTP method.
+            requests: Request URLs, or ``(url, kwargs)`` pairs whose kwargs are
+                merged over the shared ones for that request.
+            **kwargs: Request parameters applied to every request.
+
+        Yields:
+            ``(index, response)`` pairs in completion order, where `index` is the
+            request's position in `requests`. The first request to fail raises
+            its exception.
+
+        Note:
+            Leaving the loop early only cancels the outstanding requests once the
+            generator is closed, which ``async for`` doesn't do on ``break``. Wrap
+            it in `contextlib.aclosing` (or call ``aclose()``) if you might stop
+            before the end; otherwise the queued requests keep running until the
+            generator is garbage-collected.
+
+        Example:
+            ```python
+            from contextlib import aclosing
+
+            urls = [f"https://httpbin.org/anything/{i}" for i in range(100)]
+            async with aclosing(client.request_many("GET", urls)) as responses:
+                async for index, response in responses:
+                    print(urls[index], response.status_code)
+            ```
+        """
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self._executor, _send_indexed, self, method, index, request, kwargs)
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(futures):
+                yield await next_done
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+#: How many TLS configurations the module-level helpers keep a pooled client for.
+_MAX_DEFAULT_CLIENTS = 8
+
+_default_clients: dict[tuple[bool | None, str | None, str | None, bytes | None, str | None], Client] = {}
+_default_clients_lock = threading.Lock()
+
+
+def _get_default_client(
+    verify: bool | None = True,
+    ca_cert_file: str | None = None,
+    client_pem: str | None = None,
+    client_pem_data: bytes | None = None,
+) -> Client:
+    """Return the client shared by the module-level helpers for these TLS settings,
+    creating it on first use.
+
+    The CA bundle and default proxy environment variables are part of the key, so
+    changing them takes effect on the next call.
+    """
+    # `ca_cert_file` takes the place of HTTPR_CA_BUNDLE, so key on the bundle in effect.
+    ca_bundle = ca_cert_file or os.environ.get("HTTPR_CA_BUNDLE")
+    key = (verify, ca_bundle, client_pem, client_pem_data, os.environ.get("HTTPR_PROXY"))
+    client = _default_clients.get(key)
+    if client is None:
+        with _default_clients_lock:
+            client = _default_clients.get(key)
+            if client is None:
+                if len(_default_clients) >= _MAX_DEFAULT_CLIENTS:
+                    # Forget the oldest configuration; calls still using it keep their reference.
+                    del _default_clients[next(iter(_default_clients))]
+                client = Client(
+                    verify=verify,
+                    ca_cert_file=ca_cert_file,
+                    client_pem=client_pem,
+                    client_pem_data=client_pem_data,
+                )
+                # Unrelated one-off calls must not share cookies, but a redirect chain
+                # still needs the ones it sets along the way.
+                client._scope_cookies_to_calls()
+                _default_clients[key] = client
+    return client
+
+
+def _reset_default_client() -> None:
+    # A forked child must not reuse the parent's pooled connections.
+    global _default_clients, _default_clients_lock
+    _default_clients = {}
+    _default_clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_default_client)
+
 
 def request(
     method: HttpMethod,
@@ -933,10 +1161,14 @@ def request(
     **kwargs: Unpack[RequestParams],
 ) -> Response:
     """
-    Make an HTTP request using a temporary client.
+    Make an HTTP request without managing a client.
 
-    This is a convenience function for one-off requests. For multiple requests,
-    use a Client instance for better performance (connection pooling).
+    This is a convenience function for one-off requests. Calls with the same TLS
+    settings share one lazily created client, so repeated requests to the same
+    host reuse its pooled connections. Cookies set along a redirect chain are
+    sent to the following hops but not kept for later calls. Certificate files
+    are read when the client for a combination is first created. Use a Client
+    instance to control the remaining settings.
 
     Args:
         method: HTTP method (GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS).
@@ -958,18 +1190,13 @@ def request(
         response = httpr.request("POST", "https://httpbin.org/post", json={"key": "value"})
         ```
     """
-    with Client(
-        verify=verify,
-        ca_cert_file=ca_cert_file,
-        client_pem=client_pem,
-        client_pem_data=client_pem_data,
-    ) as client:
-        return client.request(method, url, **kwargs)
+    client = _get_default_client(verify, ca_cert_file, client_pem, client_pem_data)
+    return client.request(method, url, **kwargs)
 
 
 def get(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a GET request using a temporary client.
+    Make a GET request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -986,12 +1213,12 @@ def get(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         print(response.json())
         ```
     """
-    return request(method="GET", url=url, **kwargs)
+    return request("GET", url, **kwargs)
 
 
 def head(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a HEAD request using a temporary client.
+    Make a HEAD request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1008,12 +1235,12 @@ def head(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         print(response.headers)
         ```
     """
-    return request(method="HEAD", url=url, **kwargs)
+    return request("HEAD", url, **kwargs)
 
 
 def options(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make an OPTIONS request using a temporary client.
+    Make an OPTIONS request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1029,12 +1256,12 @@ def options(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         response = httpr.options("https://httpbin.org/get")
         ```
     """
-    return request(method="OPTIONS", url=url, **kwargs)
+    return request("OPTIONS", url, **kwargs)
 
 
 def delete(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a DELETE request using a temporary client.
+    Make a DELETE request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1050,12 +1277,12 @@ def delete(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         response = httpr.delete("https://httpbin.org/delete")
         ```
     """
-    return request(method="DELETE", url=url, **kwargs)
+    return request("DELETE", url, **kwargs)
 
 
 def post(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a POST request using a temporary client.
+    Make a POST request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1075,12 +1302,12 @@ def post(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         response = httpr.post("https://httpbin.org/post", data={"field": "value"})
         ```
     """
-    return request(method="POST", url=url, **kwargs)
+    return request("POST", url, **kwargs)
 
 
 def put(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a PUT request using a temporary client.
+    Make a PUT request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1096,12 +1323,12 @@ def put(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         response = httpr.put("https://httpbin.org/put", json={"key": "value"})
         ```
     """
-    return request(method="PUT", url=url, **kwargs)
+    return request("PUT", url, **kwargs)
 
 
 def patch(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
     """
-    Make a PATCH request using a temporary client.
+    Make a PATCH request using the module-level client (see `request`).
 
     Args:
         url: Request URL.
@@ -1117,7 +1344,7 @@ def patch(url: str, **kwargs: Unpack[ClientRequestParams]) -> Response:
         response = httpr.patch("https://httpbin.org/patch", json={"field": "new_value"})
         ```
     """
-    return request(method="PATCH", url=url, **kwargs)
+    return request("PATCH", url, **kwargs)
 
 
 # Import exceptions from the Rust module
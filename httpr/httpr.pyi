@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Iterator
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Literal, TypedDict
 
 if sys.version_info <= (3, 11):
@@ -19,7 +19,7 @@ class RequestParams(TypedDict, total=False):
     headers: dict[str, str] | None
     cookies: dict[str, str] | None
     timeout: float | None
-    content: bytes | None
+    content: bytes | Iterable[bytes] | None
     data: dict[str, Any] | None
     json: Any | None
     files: dict[str, str] | None
@@ -351,6 +351,8 @@ class StreamingResponse:
         Close the streaming response and release resources.
         """
         ...
+    def __enter__(self) -> StreamingResponse: ...
+    def __exit__(self, *args: Any) -> None: ...
 
 class RClient:
     def __init__(
@@ -403,6 +405,8 @@ class RClient:
     def timeout(self) -> float | None: ...
     @timeout.setter
     def timeout(self, timeout: float | None) -> None: ...
+    def close(self) -> None: ...
+    def _scope_cookies_to_calls(self) -> None: ...
     def request(self, method: HttpMethod, url: str, **kwargs: Unpack[RequestParams]) -> Response: ...
     def _stream(self, method: HttpMethod, url: str, **kwargs: Unpack[RequestParams]) -> StreamingResponse: ...
     def get(self, url: str, **kwargs: Unpack[RequestParams]) -> Response: ...
@@ -492,21 +496,19 @@ class Client(RClient):
     def close(self) -> None:
         """Close the client and release resources."""
         ...
-    def stream(
-        self, method: HttpMethod, url: str, **kwargs: Unpack[RequestParams]
-    ) -> AbstractContextManager[StreamingResponse]:
+    def stream(self, method: HttpMethod, url: str, **kwargs: Unpack[RequestParams]) -> StreamingResponse:
         """
         Make a streaming HTTP request.
 
-        Returns a context manager that yields a StreamingResponse for iterating
-        over the response body in chunks.
+        Sends the request and returns a StreamingResponse for iterating over the
+        response body in chunks. The response closes itself on leaving a `with` block.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS).
             url: Request URL.
             **kwargs: Request parameters.
 
-        Yields:
+        Returns:
             StreamingResponse: A response object that can be iterated.
 
         Example:
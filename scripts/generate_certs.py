@@ -30,20 +30,19 @@ def main() -> None:
     server_cert_path = certs_dir / "server.pem"
     server_key_path = certs_dir / "server.key"
 
-    # trustme bundles cert chain, write it properly
-    server_cert.private_key_pem.write_to_path(str(server_key_path))
+    # Create the key readable only by owner, so it never exists with wider
+    # permissions; the chmod covers a key file left over from an earlier run.
+    fd = os.open(server_key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(server_key_path, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(server_cert.private_key_pem.bytes())
 
-    # Write server cert (combines all cert blobs)
-    with open(server_cert_path, "wb") as f:
-        for blob in server_cert.cert_chain_pems:
-            f.write(blob.bytes())
+    # trustme bundles the cert chain as separate blobs; write them in one go
+    server_cert_path.write_bytes(b"".join(blob.bytes() for blob in server_cert.cert_chain_pems))
 
     print(f"Server certificate: {server_cert_path}")
     print(f"Server key: {server_key_path}")
 
-    # Make key readable only by owner
-    os.chmod(server_key_path, 0o600)
-
     print("\nCertificates generated successfully!")
     print(f"  CA cert (for httpr client): {ca_cert_path}")
     print(f"  Server cert (for httpbun): {server_cert_path}")
@@ -1,28 +1,37 @@
 #![allow(clippy::too_many_arguments)]
+use std::borrow::Cow;
+use std::pin::Pin;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, LazyLock, Mutex};
+use std::task::{Context, Poll};
 use std::time::Duration;
 use std::{fs, str};
 
 use anyhow::anyhow;
 use bytes::Bytes;
 use foldhash::fast::RandomState;
+use futures_core::Stream;
 use indexmap::IndexMap;
-use pyo3::exceptions::PyValueError;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyIterator, PyList, PyMapping, PyMemoryView, PyString, PyTuple};
 use pythonize::depythonize;
 use reqwest::{
+    cookie::{CookieStore, Jar},
     header::{HeaderValue, COOKIE},
     multipart,
     redirect::Policy,
-    Body, Identity, Method,
+    Body, Identity, Method, Url,
 };
 use serde_json::Value;
 use tokio::{
     fs::File,
     runtime::{self, Runtime},
+    sync::mpsc,
+    task::JoinHandle,
 };
 use tokio_util::codec::{BytesCodec, FramedRead};
+use tokio_util::sync::CancellationToken;
 
 mod response;
 use response::{CaseInsensitiveHeaderMap, LineIterator, Response, StreamingResponse, TextIterator};
@@ -38,6 +47,215 @@ use exceptions::{map_anyhow_error, map_reqwest_error};
 
 type IndexMapSSR = IndexMap<String, String, RandomState>;
 
+/// Parse one of the HTTP methods httpr supports, raising `ValueError` for anything else.
+fn parse_method(method: &str) -> PyResult<Method> {
+    match method {
+        "GET" => Ok(Method::GET),
+        "HEAD" => Ok(Method::HEAD),
+        "OPTIONS" => Ok(Method::OPTIONS),
+        "DELETE" => Ok(Method::DELETE),
+        "POST" => Ok(Method::POST),
+        "PUT" => Ok(Method::PUT),
+        "PATCH" => Ok(Method::PATCH),
+        _ => Err(PyValueError::new_err(format!(
+            "Unsupported HTTP method: {method}"
+        ))),
+    }
+}
+
+/// Collect query parameters into strings, calling `str()` on values that are not already one.
+///
+/// Accepts any mapping (`dict`, `MappingProxyType`, `CaseInsensitiveDict`, ...), as
+/// the Python wrapper's old `params.items()` conversion did.
+fn extract_params(params: &Bound<'_, PyMapping>) -> PyResult<IndexMapSSR> {
+    let items = params.items()?;
+    let mut map = IndexMapSSR::with_capacity_and_hasher(items.len(), RandomState::default());
+    for item in items.iter() {
+        let (key, value): (String, Bound<'_, PyAny>) = item.extract()?;
+        map.insert(key, value.str()?.to_cow()?.into_owned());
+    }
+    Ok(map)
+}
+
+/// How many chunks of a streamed `content` iterable are read ahead of the upload.
+const CONTENT_CHUNKS_AHEAD: usize = 4;
+
+/// Where the upload thread leaves the exception raised by a `content` iterable.
+type ContentError = Arc<Mutex<Option<PyErr>>>;
+
+/// Request body for `content`, plus the slot for its iterator's exception and the
+/// thread reading it (if streamed).
+struct Content {
+    body: Body,
+    error: Option<ContentError>,
+    producer: Option<ContentProducer>,
+}
+
+/// The blocking thread that feeds a `PyIterBody` from its Python iterator.
+///
+/// Dropping it tells the thread to stop before the next chunk; `finish` also waits
+/// for it, so the iterator is never advanced after the request has returned.
+struct ContentProducer {
+    stop: CancellationToken,
+    handle: JoinHandle<()>,
+}
+
+impl ContentProducer {
+    /// Stop reading the iterator and wait for the thread to exit. Call it with the
+    /// GIL released: the thread may need it to finish the `next()` it is in.
+    fn finish(mut self) {
+        self.stop.cancel();
+        let _ = RUNTIME.block_on(&mut self.handle);
+    }
+}
+
+impl Drop for ContentProducer {
+    fn drop(&mut self) {
+        self.stop.cancel();
+    }
+}
+
+/// Request body fed from a Python iterator, so a large upload never has to be
+/// joined into a single buffer first.
+///
+/// The iterator runs on a blocking thread that sends its chunks through a bounded
+/// channel: user code never runs on (or blocks) the runtime thread, and polling the
+/// body just waits for the next chunk.
+struct PyIterBody(mpsc::Receiver<std::io::Result<Bytes>>);
+
+impl PyIterBody {
+    fn spawn(iter: Py<PyIterator>, error: ContentError) -> (Self, ContentProducer) {
+        let (tx, rx) = mpsc::channel(CONTENT_CHUNKS_AHEAD);
+        let stop = CancellationToken::new();
+        let producer_stop = stop.clone();
+        let handle = RUNTIME.spawn_blocking(move || {
+            while !producer_stop.is_cancelled() {
+                let chunk = Python::attach(|py| {
+                    let mut iter = iter.bind(py).clone();
+                    iter.next()
+                        .map(|chunk| chunk.and_then(|chunk| content_chunk(&chunk)))
+                });
+                let chunk = match chunk {
+                    None => break,
+                    Some(Ok(chunk)) => Ok(chunk),
+                    Some(Err(e)) => {
+                        *error.lock().unwrap_or_else(|e| e.into_inner()) = Some(e);
+                        Err(std::io::Error::other(
+                            "content iterator raised an exception",
+                        ))
+                    }
+                };
+                let failed = chunk.is_err();
+                // Waits for room in the channel, unless the request is over: either
+                // the body was dropped (a send error) or the producer was stopped.
+                let sent = RUNTIME.handle().block_on(async {
+                    tokio::select! {
+                        sent = tx.send(chunk) => sent.is_ok(),
+                        _ = producer_stop.cancelled() => false,
+                    }
+                });
+                if !sent || failed {
+                    break;
+                }
+            }
+            Python::attach(|_| drop(iter));
+        });
+        (PyIterBody(rx), ContentProducer { stop, handle })
+    }
+}
+
+impl Stream for PyIterBody {
+    type Item = std::io::Result<Bytes>;
+
+    fn poll_next(self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<Option<Self::Item>> {
+        self.get_mut().0.poll_recv(cx)
+    }
+}
+
+/// The bytes of a bytes-like object (`bytes`, `bytearray` or `memoryview`), if it is one.
+fn bytes_like(obj: &Bound<'_, PyAny>) -> PyResult<Option<Bytes>> {
+    if let Ok(data) = obj.extract::<Cow<[u8]>>() {
+        return Ok(Some(Bytes::from(data.into_owned())));
+    }
+    if obj.is_instance_of::<PyMemoryView>() {
+        let data = obj.call_method0("tobytes")?;
+        return Ok(Some(Bytes::from(data.extract::<Cow<[u8]>>()?.into_owned())));
+    }
+    Ok(None)
+}
+
+fn type_name(obj: &Bound<'_, PyAny>) -> String {
+    obj.get_type()
+        .name()
+        .map_or_else(|_| "?".to_string(), |name| name.to_string())
+}
+
+/// One chunk of a streamed `content` iterable.
+fn content_chunk(chunk: &Bound<'_, PyAny>) -> PyResult<Bytes> {
+    bytes_like(chunk)?.ok_or_else(|| {
+        PyTypeError::new_err(format!(
+            "content chunks must be bytes-like, not {}",
+            type_name(chunk)
+        ))
+    })
+}
+
+/// Build the request body for `content`: bytes-like objects (and sequences of
+/// ints, as `bytes()` would take them) are sent as one buffer, any other iterable
+/// of bytes is streamed chunk by chunk.
+///
+/// Everything that can be checked without running the iterable is checked here,
+/// so mistakes raise a `TypeError` before the request starts: `str`, objects that
+/// aren't iterable, and lists or tuples holding anything but bytes-like chunks.
+fn extract_content(content: &Bound<'_, PyAny>) -> PyResult<Content> {
+    if let Some(data) = bytes_like(content)? {
+        return Ok(Content {
+            body: Body::from(data),
+            error: None,
+            producer: None,
+        });
+    }
+    if content.is_instance_of::<PyString>() {
+        return Err(PyTypeError::new_err(
+            "content must be bytes or an iterable of bytes, not str",
+        ));
+    }
+    // What `content` took before streaming was supported, e.g. `[104, 105]`.
+    if let Ok(data) = content.extract::<Vec<u8>>() {
+        return Ok(Content {
+            body: Body::from(data),
+            error: None,
+            producer: None,
+        });
+    }
+    if content.is_instance_of::<PyList>() || content.is_instance_of::<PyTuple>() {
+        for chunk in content.try_iter()? {
+            content_chunk(&chunk?)?;
+        }
+    }
+    let iter = content.try_iter().map_err(|_| {
+        PyTypeError::new_err(format!(
+            "content must be bytes or an iterable of bytes, not {}",
+            type_name(content)
+        ))
+    })?;
+    let error = ContentError::default();
+    let (body, producer) = PyIterBody::spawn(iter.unbind(), Arc::clone(&error));
+    Ok(Content {
+        body: Body::wrap_stream(body),
+        error: Some(error),
+        producer: Some(producer),
+    })
+}
+
+/// Map a failed request to a Python exception, re-raising the `content` iterator's
+/// own exception when that is what aborted the upload.
+fn map_request_error(err: anyhow::Error, content_error: Option<&ContentError>) -> PyErr {
+    content_error
+        .and_then(|error| error.lock().unwrap_or_else(|e| e.into_inner()).take())
+        .unwrap_or_else(|| map_anyhow_error(err))
+}
+
 // Tokio global one-thread runtime
 static RUNTIME: LazyLock<Runtime> = LazyLock::new(|| {
     runtime::Builder::new_current_thread()
@@ -46,10 +264,40 @@ static RUNTIME: LazyLock<Runtime> = LazyLock::new(|| {
         .expect("Failed to initialize Tokio runtime")
 });
 
+tokio::task_local! {
+    // The cookie jar of the request being driven by the current `block_on`.
+    static CALL_COOKIES: Jar;
+}
+
+/// A cookie store that keeps cookies only for the duration of one `request()` call.
+///
+/// Cookies set along a redirect chain are sent on to the next hop, but nothing is
+/// shared between calls, so one client (and its connection pool) can serve callers
+/// that must not see each other's cookies.
+struct CallCookieStore;
+
+impl CookieStore for CallCookieStore {
+    fn set_cookies(&self, cookie_headers: &mut dyn Iterator<Item = &HeaderValue>, url: &Url) {
+        let _ = CALL_COOKIES.try_with(|jar| jar.set_cookies(cookie_headers, url));
+    }
+
+    fn cookies(&self, url: &Url) -> Option<HeaderValue> {
+        CALL_COOKIES.try_with(|jar| jar.cookies(url)).ok().flatten()
+    }
+}
+
 #[pyclass(subclass)]
 /// HTTP client that can impersonate web browsers.
 pub struct RClient {
-    client: Arc<Mutex<reqwest::Client>>,
+    // `None` once `close()` has dropped the connection pool.
+    client: Arc<Mutex<Option<reqwest::Client>>>,
+    // Rebuilds the client with its construction-time settings (and the proxy last set
+    // through `set_proxy`) when used after `close()`.
+    build_client: Arc<dyn Fn() -> reqwest::Result<reqwest::Client> + Send + Sync>,
+    // The proxy `build_client` applies, shared with it so `set_proxy` outlives `close()`.
+    rproxy: Arc<Mutex<Option<reqwest::Proxy>>>,
+    // Whether `build_client` uses a `CallCookieStore` instead of `cookie_store`.
+    call_cookies: Arc<AtomicBool>,
     headers: Arc<Mutex<reqwest::header::HeaderMap>>,
     #[pyo3(get, set)]
     auth: Option<(String, Option<String>)>,
@@ -63,6 +311,25 @@ pub struct RClient {
     timeout: Option<f64>,
 }
 
+impl RClient {
+    /// A handle to the underlying reqwest client (a cheap `Arc` clone), reopening it
+    /// with a fresh connection pool if `close()` was called.
+    fn inner_client(&self) -> PyResult<reqwest::Client> {
+        let mut client = self
+            .client
+            .lock()
+            .map_err(|e| map_anyhow_error(anyhow!("Failed to acquire client lock: {}", e)))?;
+        match client.as_ref() {
+            Some(client) => Ok(client.clone()),
+            None => {
+                let reopened = (self.build_client)().map_err(map_reqwest_error)?;
+                *client = Some(reopened.clone());
+                Ok(reopened)
+            }
+        }
+    }
+}
+
 #[pymethods]
 impl RClient {
     /// Initializes an HTTP client that can impersonate web browsers.
@@ -141,9 +408,6 @@ impl RClient {
                 "Only one of client_pem or client_pem_data may be set.",
             ));
         }
-        // Client builder
-        let mut client_builder = reqwest::Client::builder();
-
         // Headers || Cookies
         let headers_headermap = if headers.is_some() || cookies.is_some() {
             let headers = headers.unwrap_or_else(|| IndexMap::with_hasher(RandomState::default()));
@@ -156,87 +420,128 @@ impl RClient {
                         .map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?,
                 );
             }
-            client_builder = client_builder.default_headers(headers_headermap.clone());
             headers_headermap
         } else {
             reqwest::header::HeaderMap::new()
         };
 
-        // Cookie_store
-        if cookie_store.unwrap_or(true) {
-            client_builder = client_builder.cookie_store(true);
-        }
-
-        // Referer
-        if referer.unwrap_or(true) {
-            client_builder = client_builder.referer(true);
-        }
-
         // Proxy
         let proxy = proxy.or_else(|| std::env::var("HTTPR_PROXY").ok());
-        if let Some(proxy) = &proxy {
-            client_builder =
-                client_builder.proxy(reqwest::Proxy::all(proxy).map_err(map_reqwest_error)?);
-        }
-
-        // Timeout
-        if let Some(seconds) = timeout {
-            client_builder = client_builder.timeout(Duration::from_secs_f64(seconds));
-        }
-
-        // Redirects
-        if follow_redirects.unwrap_or(true) {
-            client_builder = client_builder.redirect(Policy::limited(max_redirects.unwrap_or(20)));
-        } else {
-            client_builder = client_builder.redirect(Policy::none());
-        }
+        let rproxy = proxy
+            .as_deref()
+            .map(reqwest::Proxy::all)
+            .transpose()
+            .map_err(map_reqwest_error)?;
+        let rproxy = Arc::new(Mutex::new(rproxy));
 
         // Ca_cert_file. BEFORE!!! verify (fn load_ca_certs() reads env var HTTPR_CA_BUNDLE)
         if let Some(ca_bundle_path) = &ca_cert_file {
             std::env::set_var("HTTPR_CA_BUNDLE", ca_bundle_path);
         }
-
-        // Verify
-        if verify.unwrap_or(true) {
-            client_builder = client_builder.tls_built_in_root_certs(true);
-            for cert in load_ca_certs().map_err(map_anyhow_error)? {
-                client_builder = client_builder.add_root_certificate(cert);
-            }
+        let verify = verify.unwrap_or(true);
+        let ca_certs = if verify {
+            load_ca_certs().map_err(map_anyhow_error)?
         } else {
-            client_builder = client_builder.danger_accept_invalid_certs(true);
-        }
+            Vec::new()
+        };
 
         // Client mTLS identity must be applied regardless of `verify`: disabling
         // server verification doesn't imply disabling client authentication.
-        let client_identity_pem = if let Some(pem_data) = &client_pem_data {
-            Some(pem_data.clone())
+        let client_identity_pem = if let Some(pem_data) = client_pem_data {
+            Some(pem_data)
         } else if let Some(pem_path) = &client_pem {
             Some(fs::read(pem_path).map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?)
         } else {
             None
         };
 
-        if let Some(pem_bytes) = client_identity_pem {
-            let identity = Identity::from_pem(&pem_bytes).map_err(map_reqwest_error)?;
-            client_builder = client_builder.identity(identity);
-        }
+        // Everything that can fail before reqwest's own checks is resolved above, so the
+        // builder can be replayed to reopen the client after `close()`.
+        let headers = Arc::new(Mutex::new(headers_headermap));
+        let client_headers = Arc::clone(&headers);
+        let client_rproxy = Arc::clone(&rproxy);
+        let call_cookies = Arc::new(AtomicBool::new(false));
+        let client_call_cookies = Arc::clone(&call_cookies);
+        let build_client = move || -> reqwest::Result<reqwest::Client> {
+            let mut client_builder = reqwest::Client::builder();
 
-        // Https_only
-        if let Some(true) = https_only {
-            client_builder = client_builder.https_only(true);
-        }
+            // Default headers as they are now, not as they were at construction, so a
+            // client reopened after `close()` doesn't bring back replaced or deleted ones.
+            // (Auth and params are read from `self` on every request.)
+            let default_headers = client_headers
+                .lock()
+                .unwrap_or_else(|e| e.into_inner())
+                .clone();
+            if !default_headers.is_empty() {
+                client_builder = client_builder.default_headers(default_headers);
+            }
 
-        // Http2_only
-        if let Some(true) = http2_only {
-            client_builder = client_builder.http2_prior_knowledge();
-        }
-        let client = Arc::new(Mutex::new(
-            client_builder.build().map_err(map_reqwest_error)?,
-        ));
-        let headers = Arc::new(Mutex::new(headers_headermap));
+            // Cookie_store
+            if client_call_cookies.load(Ordering::Relaxed) {
+                client_builder = client_builder.cookie_provider(Arc::new(CallCookieStore));
+            } else if cookie_store.unwrap_or(true) {
+                client_builder = client_builder.cookie_store(true);
+            }
+
+            // Referer
+            if referer.unwrap_or(true) {
+                client_builder = client_builder.referer(true);
+            }
+
+            // Proxy. A poisoned lock still holds a valid proxy, so recover it.
+            let rproxy = client_rproxy
+                .lock()
+                .unwrap_or_else(|e| e.into_inner())
+                .clone();
+            if let Some(rproxy) = rproxy {
+                client_builder = client_builder.proxy(rproxy);
+            }
+
+            // Timeout
+            if let Some(seconds) = timeout {
+                client_builder = client_builder.timeout(Duration::from_secs_f64(seconds));
+            }
+
+            // Redirects
+            if follow_redirects.unwrap_or(true) {
+                client_builder =
+                    client_builder.redirect(Policy::limited(max_redirects.unwrap_or(20)));
+            } else {
+                client_builder = client_builder.redirect(Policy::none());
+            }
+
+            // Verify
+            if verify {
+                client_builder = client_builder.tls_built_in_root_certs(true);
+                for cert in &ca_certs {
+                    client_builder = client_builder.add_root_certificate(cert.clone());
+                }
+            } else {
+                client_builder = client_builder.danger_accept_invalid_certs(true);
+            }
+
+            if let Some(pem_bytes) = &client_identity_pem {
+                client_builder = client_builder.identity(Identity::from_pem(pem_bytes)?);
+            }
+
+            // Https_only
+            if let Some(true) = https_only {
+                client_builder = client_builder.https_only(true);
+            }
+
+            // Http2_only
+            if let Some(true) = http2_only {
+                client_builder = client_builder.http2_prior_knowledge();
+            }
+            client_builder.build()
+        };
+        let client = Arc::new(Mutex::new(Some(build_client().map_err(map_reqwest_error)?)));
 
         Ok(RClient {
             client,
+            build_client: Arc::new(build_client),
+            rproxy,
+            call_cookies,
             headers,
             auth,
             auth_bearer,
@@ -339,33 +644,79 @@ impl RClient {
         Ok(self.proxy.to_owned())
     }
 
+    /// Routes requests through `proxy`, keeping the client's other settings.
+    ///
+    /// The proxy also applies when the client is reopened after `close()`.
     #[setter]
     pub fn set_proxy(&mut self, proxy: String) -> PyResult<()> {
         let rproxy = reqwest::Proxy::all(proxy.clone()).map_err(map_reqwest_error)?;
-        let new_client = reqwest::Client::builder()
-            .proxy(rproxy)
-            .build()
-            .map_err(map_reqwest_error)?;
         let mut client = self
             .client
             .lock()
             .map_err(|e| map_anyhow_error(anyhow!("Failed to acquire client lock: {}", e)))?;
-        *client = new_client;
+        let previous = {
+            let mut current = self
+                .rproxy
+                .lock()
+                .map_err(|e| map_anyhow_error(anyhow!("Failed to acquire proxy lock: {}", e)))?;
+            current.replace(rproxy)
+        };
+        match (self.build_client)() {
+            Ok(new_client) => *client = Some(new_client),
+            Err(e) => {
+                // Leave the client as it was, so a later reopen doesn't pick up a proxy
+                // that could not be applied.
+                *self.rproxy.lock().map_err(|e| {
+                    map_anyhow_error(anyhow!("Failed to acquire proxy lock: {}", e))
+                })? = previous;
+                return Err(map_reqwest_error(e));
+            }
+        }
         self.proxy = Some(proxy);
         Ok(())
     }
 
+    /// Keeps cookies only for the duration of each call, overriding `cookie_store`.
+    ///
+    /// Cookies received along a redirect chain are still sent to the following hops,
+    /// but none are carried over to the next call. Used by the module-level helpers,
+    /// which share one client between unrelated callers.
+    pub fn _scope_cookies_to_calls(&self) -> PyResult<()> {
+        let mut client = self
+            .client
+            .lock()
+            .map_err(|e| map_anyhow_error(anyhow!("Failed to acquire client lock: {}", e)))?;
+        self.call_cookies.store(true, Ordering::Relaxed);
+        *client = Some((self.build_client)().map_err(map_reqwest_error)?);
+        Ok(())
+    }
+
+    /// Closes the client, dropping its connection pool (and cookie store).
+    ///
+    /// Requests already in flight (and open streaming responses) finish normally. A
+    /// later request reopens the client with the settings it was created with.
+    pub fn close(&self) -> PyResult<()> {
+        let mut client = self
+            .client
+            .lock()
+            .map_err(|e| map_anyhow_error(anyhow!("Failed to acquire client lock: {}", e)))?;
+        *client = None;
+        Ok(())
+    }
+
     /// Constructs an HTTP request with the given method, URL, and optionally sets a timeout, headers, and query parameters.
     /// Sends the request and returns a `Response` object containing the server's response.
     ///
     /// # Arguments
     ///
-    /// * `method` - The HTTP method to use (e.g., "GET", "POST").
+    /// * `method` - The HTTP method to use (GET, HEAD, OPTIONS, DELETE, POST, PUT or PATCH).
     /// * `url` - The URL to which the request will be made.
-    /// * `params` - A map of query parameters to append to the URL. Default is None.
+    /// * `params` - A map of query parameters to append to the URL; non-string values are
+    ///   converted with `str()`. Default is None.
     /// * `headers` - A map of HTTP headers to send with the request. Default is None.
     /// * `cookies` - An optional map of cookies to send with requests as the `Cookie` header.
-    /// * `content` - The content to send in the request body as bytes. Default is None.
+    /// * `content` - The content to send in the request body: bytes, or an iterable of bytes
+    ///   that is streamed chunk by chunk. Default is None.
     /// * `data` - The form data to send in the request body. Default is None.
     /// * `json` -  A JSON serializable object to send in the request body. Default is None.
     /// * `cbor` -  A CBOR serializable object to send in the request body. Default is None.
@@ -381,6 +732,7 @@ impl RClient {
     /// # Errors
     ///
     /// Raises specific exceptions based on the error type:
+    /// * `ValueError` - If the method is not one of the supported ones
     /// * `InvalidURL` - If the URL is malformed
     /// * `ConnectTimeout` - If connection times out
     /// * `ReadTimeout` - If reading response times out
@@ -398,10 +750,10 @@ impl RClient {
         py: Python,
         method: &str,
         url: &str,
-        params: Option<IndexMapSSR>,
+        params: Option<&Bound<'_, PyMapping>>,
         headers: Option<IndexMapSSR>,
         cookies: Option<IndexMapSSR>,
-        content: Option<Vec<u8>>,
+        content: Option<&Bound<'_, PyAny>>,
         data: Option<&Bound<'_, PyAny>>,
         json: Option<&Bound<'_, PyAny>>,
         files: Option<IndexMap<String, String>>,
@@ -409,11 +761,13 @@ impl RClient {
         auth_bearer: Option<String>,
         timeout: Option<f64>,
     ) -> PyResult<Response> {
-        let client = Arc::clone(&self.client);
-        let method = Method::from_bytes(method.as_bytes())
-            .map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?;
+        let client = self.inner_client()?;
+        let method = parse_method(method)?;
         let is_post_put_patch = matches!(method, Method::POST | Method::PUT | Method::PATCH);
-        let params = params.or_else(|| self.params.clone());
+        let params = params
+            .map(extract_params)
+            .transpose()?
+            .or_else(|| self.params.clone());
         let data_value: Option<Value> = data
             .map(depythonize)
             .transpose()
@@ -422,16 +776,21 @@ impl RClient {
             .map(depythonize)
             .transpose()
             .map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?;
+        // Like `data` and `json`, `content` is only sent with POST, PUT and PATCH, so
+        // don't start reading an iterator for other methods.
+        let mut content = content
+            .filter(|_| is_post_put_patch)
+            .map(extract_content)
+            .transpose()?;
+        let content_error = content.as_ref().and_then(|content| content.error.clone());
+        let content_producer = content.as_mut().and_then(|content| content.producer.take());
         let auth = auth.or(self.auth.clone());
         let auth_bearer = auth_bearer.or(self.auth_bearer.clone());
         let timeout: Option<f64> = timeout.or(self.timeout);
 
         let future = async {
             // Create request builder
-            let mut request_builder = client
-                .lock()
-                .map_err(|e| anyhow!("Failed to acquire client lock: {}", e))?
-                .request(method, url);
+            let mut request_builder = client.request(method, url);
 
             // Params
             if let Some(params) = params {
@@ -468,7 +827,7 @@ impl RClient {
             if is_post_put_patch {
                 // Content
                 if let Some(content) = content {
-                    request_builder = request_builder.body(content);
+                    request_builder = request_builder.body(content.body);
                 }
                 // Data
                 if let Some(form_data) = data_value {
@@ -529,9 +888,18 @@ impl RClient {
 
         // Execute an async future, releasing the Python GIL for concurrency.
         // Use Tokio global runtime to block on the future.
-        let result = py.detach(|| RUNTIME.block_on(future));
+        // Each call gets its own jar, used when cookies are scoped to calls.
+        let future = CALL_COOKIES.scope(Jar::default(), future);
+        let result = py.detach(|| {
+            let result = RUNTIME.block_on(future);
+            // Whatever the outcome, stop the upload before returning to Python.
+            if let Some(producer) = content_producer {
+                producer.finish();
+            }
+            result
+        });
         let (f_buf, f_cookies, f_headers, f_status_code, f_url) =
-            result.map_err(map_anyhow_error)?;
+            result.map_err(|e| map_request_error(e, content_error.as_ref()))?;
 
         Ok(Response {
             content: PyBytes::new(py, &f_buf).unbind(),
@@ -571,10 +939,10 @@ impl RClient {
         py: Python,
         method: &str,
         url: &str,
-        params: Option<IndexMapSSR>,
+        params: Option<&Bound<'_, PyMapping>>,
         headers: Option<IndexMapSSR>,
         cookies: Option<IndexMapSSR>,
-        content: Option<Vec<u8>>,
+        content: Option<&Bound<'_, PyAny>>,
         data: Option<&Bound<'_, PyAny>>,
         json: Option<&Bound<'_, PyAny>>,
         files: Option<IndexMap<String, String>>,
@@ -582,11 +950,13 @@ impl RClient {
         auth_bearer: Option<String>,
         timeout: Option<f64>,
     ) -> PyResult<StreamingResponse> {
-        let client = Arc::clone(&self.client);
-        let method = Method::from_bytes(method.as_bytes())
-            .map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?;
+        let client = self.inner_client()?;
+        let method = parse_method(method)?;
         let is_post_put_patch = matches!(method, Method::POST | Method::PUT | Method::PATCH);
-        let params = params.or_else(|| self.params.clone());
+        let params = params
+            .map(extract_params)
+            .transpose()?
+            .or_else(|| self.params.clone());
         let data_value: Option<Value> = data
             .map(depythonize)
             .transpose()
@@ -595,16 +965,21 @@ impl RClient {
             .map(depythonize)
             .transpose()
             .map_err(|e| map_anyhow_error(anyhow::Error::new(e)))?;
+        // Like `data` and `json`, `content` is only sent with POST, PUT and PATCH, so
+        // don't start reading an iterator for other methods.
+        let mut content = content
+            .filter(|_| is_post_put_patch)
+            .map(extract_content)
+            .transpose()?;
+        let content_error = content.as_ref().and_then(|content| content.error.clone());
+        let content_producer = content.as_mut().and_then(|content| content.producer.take());
         let auth = auth.or(self.auth.clone());
         let auth_bearer = auth_bearer.or(self.auth_bearer.clone());
         let timeout: Option<f64> = timeout.or(self.timeout);
 
         let future = async {
             // Create request builder
-            let mut request_builder = client
-                .lock()
-                .map_err(|e| anyhow!("Failed to acquire client lock: {}", e))?
-                .request(method, url);
+            let mut request_builder = client.request(method, url);
 
             // Params
             if let Some(params) = params {
@@ -641,7 +1016,7 @@ impl RClient {
             if is_post_put_patch {
                 // Content
                 if let Some(content) = content {
-                    request_builder = request_builder.body(content);
+                    request_builder = request_builder.body(content.body);
                 }
                 // Data
                 if let Some(form_data) = data_value {
@@ -700,9 +1075,18 @@ impl RClient {
         };
 
         // Execute an async future, releasing the Python GIL for concurrency.
-        let result = py.detach(|| RUNTIME.block_on(future));
+        // Each call gets its own jar, used when cookies are scoped to calls.
+        let future = CALL_COOKIES.scope(Jar::default(), future);
+        let result = py.detach(|| {
+            let result = RUNTIME.block_on(future);
+            // Whatever the outcome, stop the upload before returning to Python.
+            if let Some(producer) = content_producer {
+                producer.finish();
+            }
+            result
+        });
         let (f_resp, f_cookies, f_headers, f_status_code, f_url) =
-            result.map_err(map_anyhow_error)?;
+            result.map_err(|e| map_request_error(e, content_error.as_ref()))?;
 
         Ok(StreamingResponse::new(
             f_resp,
@@ -285,18 +285,20 @@ impl Response {
         // Check if Content-Type is application/cbor
         let content_type = self.headers.get("content-type".to_string(), None);
 
+        let raw_bytes = self.content.as_bytes(py);
+
         if content_type.to_lowercase().contains("application/cbor") {
-            // Deserialize as CBOR
-            let cbor_value: serde_json::Value =
-                serde_cbor_2::from_reader(self.content.as_bytes(py))
-                    .map_err(|e| anyhow!("Failed to deserialize CBOR: {}", e))?;
+            // Deserialize as CBOR, without the GIL; only pythonize needs it.
+            let cbor_value: serde_json::Value = py
+                .detach(|| serde_cbor_2::from_reader(raw_bytes))
+                .map_err(|e| anyhow!("Failed to deserialize CBOR: {}", e))?;
             let result = pythonize(py, &cbor_value)
                 .map_err(|e| anyhow!("Failed to convert CBOR to Python object: {}", e))?
                 .unbind();
             Ok(result)
         } else {
-            // Deserialize as JSON (default)
-            let json_value: serde_json::Value = from_slice(self.content.as_bytes(py))?;
+            // Deserialize as JSON (default), without the GIL; only pythonize needs it.
+            let json_value: serde_json::Value = py.detach(|| from_slice(raw_bytes))?;
             let result = pythonize(py, &json_value)
                 .map_err(|e| anyhow!("Failed to convert JSON to Python object: {}", e))?
                 .unbind();
@@ -305,7 +307,9 @@ impl Response {
     }
 
     fn cbor(&mut self, py: Python) -> Result<Py<PyAny>> {
-        let cbor_value: serde_json::Value = serde_cbor_2::from_reader(self.content.as_bytes(py))
+        let raw_bytes = self.content.as_bytes(py);
+        let cbor_value: serde_json::Value = py
+            .detach(|| serde_cbor_2::from_reader(raw_bytes))
             .map_err(|e| anyhow!("Failed to deserialize CBOR: {}", e))?;
         let result = pythonize(py, &cbor_value)
             .map_err(|e| anyhow!("Failed to convert CBOR to Python object: {}", e))?
@@ -641,6 +645,20 @@ impl StreamingResponse {
         Ok(())
     }
 
+    fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    /// Closes the response on leaving a `with` block; exceptions propagate.
+    fn __exit__(
+        &self,
+        _exc_type: Option<&Bound<'_, PyAny>>,
+        _exc_value: Option<&Bound<'_, PyAny>>,
+        _traceback: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<()> {
+        self.close()
+    }
+
     /// Check if the stream has been closed.
     #[getter]
     fn is_closed(&self) -> PyResult<bool> {
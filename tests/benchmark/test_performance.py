@@ -32,38 +32,42 @@ class TestSyncClient:
 
     def test_single_request(self, benchmark, base_url):
         """Benchmark single GET request without session reuse."""
+        url = f"{base_url}/get"
 
         def make_request():
             with httpr.Client() as client:
-                return client.get(f"{base_url}/get").text
+                return client.get(url).text
 
         benchmark(make_request)
 
     def test_session_reuse(self, benchmark, base_url):
         """Benchmark GET request with session reuse."""
+        url = f"{base_url}/get"
         with httpr.Client() as client:
 
             def make_request():
-                return client.get(f"{base_url}/get").text
+                return client.get(url).text
 
             benchmark(make_request)
 
     def test_json_parsing(self, benchmark, base_url):
         """Benchmark JSON response parsing."""
+        url = f"{base_url}/json"
         with httpr.Client() as client:
 
             def parse_json():
-                return client.get(f"{base_url}/json").json()
+                return client.get(url).json()
 
             benchmark(parse_json)
 
     def test_post_json(self, benchmark, base_url):
         """Benchmark POST request with JSON body."""
         payload = {"key": "value", "number": 42, "nested": {"a": 1, "b": 2}}
+        url = f"{base_url}/post"
         with httpr.Client() as client:
 
             def post_json():
-                return client.post(f"{base_url}/post", json=payload).json()
+                return client.post(url, json=payload).json()
 
             benchmark(post_json)
 
@@ -77,13 +81,34 @@ class TestAsyncClient:
         Each iteration creates a new event loop + AsyncClient context.
         This measures the full async overhead, not just request time.
         """
+        url = f"{base_url}/get"
 
         async def run():
             async with httpr.AsyncClient() as client:
-                return await client.get(f"{base_url}/get")
+                return await client.get(url)
 
         benchmark(lambda: asyncio.run(run()))
 
+    def test_session_reuse(self, benchmark, base_url):
+        """Benchmark async GET request with session reuse.
+
+        The event loop and AsyncClient are created once, so each iteration is
+        just the request and its executor round trip -- the async counterpart of
+        TestSyncClient.test_session_reuse.
+        """
+        url = f"{base_url}/get"
+        loop = asyncio.new_event_loop()
+        client = httpr.AsyncClient()
+        try:
+
+            def make_request():
+                return loop.run_until_complete(client.get(url)).text
+
+            benchmark(make_request)
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
+
     @pytest.mark.parametrize("max_concurrency", [8, 32, 64], ids=["8", "32", "64"])
     def test_concurrent_requests(self, benchmark, bench_server_url, max_concurrency):
         """Benchmark 64 concurrent requests at a given `max_concurrency`.
@@ -103,10 +128,11 @@ class TestAsyncClient:
         test_concurrency_is_not_capped_by_the_default_executor.
         """
         n_requests = 64
+        url = f"{bench_server_url}/json/1"
 
         async def run():
             async with httpr.AsyncClient(max_concurrency=max_concurrency) as client:
-                return await asyncio.gather(*[client.get(f"{bench_server_url}/json/1") for _ in range(n_requests)])
+                return await asyncio.gather(*[client.get(url) for _ in range(n_requests)])
 
         benchmark.group = "Async concurrency (64 requests)"
         benchmark(lambda: asyncio.run(run()))
@@ -126,10 +152,11 @@ class TestResponseSizes:
     )
     def test_response_size(self, benchmark, base_url, size, name):
         """Benchmark response handling for different sizes."""
+        url = f"{base_url}/bytes/{size}"
         with httpr.Client() as client:
 
             def fetch():
-                return client.get(f"{base_url}/bytes/{size}").content
+                return client.get(url).content
 
             benchmark.group = f"Response Size ({name})"
             benchmark(fetch)
@@ -141,10 +168,11 @@ class TestHeaders:
     def test_many_headers(self, benchmark, base_url):
         """Benchmark request with many custom headers."""
         headers = {f"X-Custom-Header-{i}": f"value-{i}" for i in range(20)}
+        url = f"{base_url}/headers"
         with httpr.Client(headers=headers) as client:
 
             def make_request():
-                return client.get(f"{base_url}/headers").json()
+                return client.get(url).json()
 
             benchmark(make_request)
 
@@ -163,10 +191,11 @@ class TestCBORDecoding:
     )
     def test_cbor_request(self, benchmark, bench_server_url, count):
         """Benchmark httpr CBOR request and decoding for different payload sizes."""
+        url = f"{bench_server_url}/cbor/{count}"
         with httpr.Client() as client:
 
             def fetch_and_decode():
-                response = client.get(f"{bench_server_url}/cbor/{count}")
+                response = client.get(url)
                 return response.cbor()
 
             benchmark.group = f"CBOR Request ({count} arrays)"
@@ -179,10 +208,11 @@ class TestCBORDecoding:
     )
     def test_json_request(self, benchmark, bench_server_url, count):
         """Benchmark httpr JSON request and decoding for comparison with CBOR."""
+        url = f"{bench_server_url}/json/{count}"
         with httpr.Client() as client:
 
             def fetch_and_decode():
-                response = client.get(f"{bench_server_url}/json/{count}")
+                response = client.get(url)
                 return response.json()
 
             benchmark.group = f"JSON Request ({count} arrays)"
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import os
 import threading
 
@@ -109,3 +110,28 @@ async def test_client_stays_reusable_across_contexts(base_url):
 
     await client.aclose()
     assert (await client.get(f"{base_url}/anything")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_request_many_yields_indexes(base_url):
+    client = httpr.AsyncClient(max_concurrency=4)
+    urls = [f"{base_url}/anything/{i}" for i in range(10)]
+    requests = [*urls[:-1], (urls[-1], {"params": {"q": "2"}})]
+    responses = {i: r async for i, r in client.request_many("GET", requests, params={"q": "1"})}
+    assert sorted(responses) == list(range(10))
+    assert [responses[i].json()["url"] for i in range(9)] == [f"{url}?q=1" for url in urls[:-1]]
+    assert responses[9].json()["url"] == f"{urls[-1]}?q=2"
+
+
+@pytest.mark.asyncio
+async def test_request_many_stops_at_the_first_failure(base_url):
+    client = httpr.AsyncClient(max_concurrency=2)
+    # Nothing listens on port 1, so the second request fails to connect.
+    urls = [f"{base_url}/anything/0", "http://127.0.0.1:1/"] + [f"{base_url}/anything/{i}" for i in range(2, 10)]
+    received = []
+    with pytest.raises(Exception):
+        async with contextlib.aclosing(client.request_many("GET", urls)) as responses:
+            async for index, _ in responses:
+                received.append(index)
+    assert 1 not in received
+    assert len(received) < len(urls) - 1
@@ -8,19 +8,21 @@ import pytest
 
 import httpr
 
+# Encoded once at import; the handler only writes the bytes out.
+CBOR_BODIES = {
+    "/cbor/echo": cbor2.dumps({"message": "CBOR response", "count": 42, "items": [1, 2, 3, 4, 5]}),
+    "/cbor/large": cbor2.dumps([[i + j * 0.1 for j in range(1024)] for i in range(10)]),
+}
+
 
 class CborHandler(BaseHTTPRequestHandler):
     """Serves CBOR responses for testing."""
 
     def do_GET(self):
-        if self.path == "/cbor/echo":
-            data = {"message": "CBOR response", "count": 42, "items": [1, 2, 3, 4, 5]}
-        elif self.path == "/cbor/large":
-            data = [[i + j * 0.1 for j in range(1024)] for i in range(10)]
-        else:
+        body = CBOR_BODIES.get(self.path)
+        if body is None:
             self.send_error(404)
             return
-        body = cbor2.dumps(data)
         self.send_response(200)
         self.send_header("Content-Type", "application/cbor")
         self.send_header("Content-Length", str(len(body)))
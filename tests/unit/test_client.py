@@ -1,3 +1,5 @@
+import types
+
 import pytest
 
 import httpr  # type: ignore
@@ -76,6 +78,23 @@ def test_headers_mutation_preserves_cookies():
     assert client.cookies == {"session": "abc123"}
 
 
+def test_headers_view_stays_in_sync():
+    client = httpr.Client(headers={"X-A": "1"})
+    headers = client.headers
+    assert client.headers is headers
+
+    # A value Rust rejects must not be left behind in the cached view.
+    with pytest.raises(Exception):
+        headers["x-bad"] = "a\nb"
+    assert "x-bad" not in client.headers
+
+    client.set_header("X-B", "2")
+    assert client.headers == {"x-a": "1", "x-b": "2"}
+
+    client.headers = {"X-C": "3"}
+    assert client.headers == {"x-c": "3"}
+
+
 def test_invalid_file_path_exception(base_url_ssl, ca_bundle):
     client = httpr.Client(ca_cert_file=ca_bundle)
     # Passing a non-existent file path in files should raise an exception.
@@ -209,6 +228,53 @@ def test_client_post_content(base_url_ssl, ca_bundle):
     assert json_data["data"] == "test content"
 
 
+def test_client_post_content_iterable(base_url):
+    client = httpr.Client()
+    chunks = (part.encode() for part in ("test ", "streamed ", "content"))
+    response = client.post(f"{base_url}/anything", content=chunks)
+    assert response.json()["data"] == "test streamed content"
+
+    with pytest.raises(TypeError):
+        client.post(f"{base_url}/anything", content="not bytes")  # type: ignore[arg-type]
+
+
+def test_client_post_content_bytes_like(base_url):
+    client = httpr.Client()
+    response = client.post(f"{base_url}/anything", content=memoryview(b"viewed content"))
+    assert response.json()["data"] == "viewed content"
+    response = client.post(f"{base_url}/anything", content=[b"listed ", bytearray(b"content")])
+    assert response.json()["data"] == "listed content"
+
+    response = client.post(f"{base_url}/anything", content=[104, 105])  # type: ignore[list-item]
+    assert response.json()["data"] == "hi"
+
+    # Checked before the request starts, not while the body is being sent.
+    with pytest.raises(TypeError, match="int"):
+        client.post(f"{base_url}/anything", content=[b"mixed", 1])  # type: ignore[list-item]
+
+
+def test_client_get_ignores_content_iterable(base_url):
+    pulled = []
+
+    def chunks():
+        pulled.append(True)
+        yield b"unused"
+
+    client = httpr.Client()
+    assert client.get(f"{base_url}/anything", content=chunks()).status_code == 200
+    assert pulled == []
+
+
+def test_client_post_content_iterable_reraises(base_url):
+    def chunks():
+        yield b"partial "
+        raise ValueError("producer failed")
+
+    client = httpr.Client()
+    with pytest.raises(ValueError, match="producer failed"):
+        client.post(f"{base_url}/anything", content=chunks())
+
+
 def test_client_post_data(base_url_ssl, ca_bundle):
     client = httpr.Client(ca_cert_file=ca_bundle)
     auth_bearer = "bearerXXXXXXXXXXXXXXXXXXXX"
@@ -281,6 +347,13 @@ def test_client_number_params(base_url_ssl, ca_bundle):
     assert float(json_data["args"]["small_float"]) == 0.026305610314011577
 
 
+def test_client_mapping_params(base_url):
+    client = httpr.Client()
+    params = types.MappingProxyType({"x": "aaa", "n": 1})
+    response = client.get(f"{base_url}/anything", params=params)  # type: ignore[arg-type]
+    assert response.json()["args"] == {"x": "aaa", "n": "1"}
+
+
 def test_header_case_preservation(base_url_ssl, ca_bundle):
     client = httpr.Client(ca_cert_file=ca_bundle)
 
@@ -417,3 +490,74 @@ def test_graceful_invalid_header_handling(base_url_ssl, ca_bundle):
     json_data = response.json()
     assert json_data["headers"]["X-Valid-Header"] == "valid-value"
     assert json_data["headers"]["User-Agent"] == "test"
+
+
+def test_close_drops_cookies_and_reopens(base_url):
+    client = httpr.Client(headers={"X-Test": "kept"})
+    client.get(f"{base_url}/cookies/set?k=v")
+    assert client.get(f"{base_url}/cookies").json()["cookies"] == {"k": "v"}
+
+    client.close()
+    client.close()
+    # Reopened with the original settings, but with a fresh cookie store.
+    response = client.get(f"{base_url}/anything")
+    assert response.json()["headers"]["X-Test"] == "kept"
+    assert client.get(f"{base_url}/cookies").json()["cookies"] == {}
+
+
+def test_close_reopens_with_current_headers(base_url):
+    client = httpr.Client(headers={"X-Old": "1"})
+    client.headers = {"X-New": "2"}
+    client.close()
+    headers = client.get(f"{base_url}/headers").json()["headers"]
+    assert headers["X-New"] == "2"
+    assert "X-Old" not in headers
+
+
+def test_request_many_yields_indexes(base_url):
+    client = httpr.Client()
+    urls = [f"{base_url}/anything/{i}" for i in range(10)]
+    responses = dict(client.request_many("GET", urls, params={"q": "1"}))
+    assert sorted(responses) == list(range(10))
+    assert [responses[i].json()["url"] for i in range(10)] == [f"{url}?q=1" for url in urls]
+
+
+def test_request_many_per_request_kwargs(base_url):
+    client = httpr.Client()
+    requests = [f"{base_url}/anything", (f"{base_url}/anything", {"params": {"q": "2"}})]
+    responses = dict(client.request_many("GET", requests, params={"q": "1"}, headers={"X-Test": "t"}))
+    assert responses[0].json()["args"] == {"q": "1"}
+    assert responses[1].json()["args"] == {"q": "2"}
+    assert responses[1].json()["headers"]["X-Test"] == "t"
+
+
+def test_request_many_raises_the_first_failure(base_url):
+    client = httpr.Client()
+    # Nothing listens on port 1, so the middle request fails to connect.
+    urls = [f"{base_url}/anything/0", "http://127.0.0.1:1/", f"{base_url}/anything/2"]
+    with pytest.raises(Exception):
+        list(client.request_many("GET", urls))
+
+
+def test_close_releases_request_many_threads(base_url):
+    client = httpr.Client()
+    assert client._executor is None
+    list(client.request_many("GET", [f"{base_url}/anything"]))
+    executor = client._executor
+    assert executor is not None
+    client.close()
+    assert client._executor is None
+    assert executor._shutdown
+    assert dict(client.request_many("GET", [f"{base_url}/anything"]))[0].status_code == 200
+
+
+def test_set_proxy_survives_close(base_url):
+    client = httpr.Client()
+    # Nothing listens on port 1, so a request only succeeds if it bypasses the proxy.
+    client.proxy = "http://127.0.0.1:1"
+    with pytest.raises((httpr.ProxyError, httpr.ConnectError, httpr.NetworkError)):
+        client.get(f"{base_url}/anything")
+    client.close()
+    with pytest.raises((httpr.ProxyError, httpr.ConnectError, httpr.NetworkError)):
+        client.get(f"{base_url}/anything")
+    assert client.proxy == "http://127.0.0.1:1"
@@ -247,3 +247,29 @@ def test_put(base_url_ssl, ca_bundle):
     assert json_data["headers"]["Authorization"] == "Bearer bearerXXXXXXXXXXXXXXXXXXXX"
     assert json_data["args"] == {"x": "aaa", "y": "bbb"}
     assert json_data["form"] == {"key1": "value1", "key2": "value2"}
+
+
+def test_default_client_is_shared(base_url, monkeypatch):
+    monkeypatch.setattr(httpr, "_default_clients", {})
+    httpr.get(f"{base_url}/get")
+    (shared,) = httpr._default_clients.values()
+    httpr.get(f"{base_url}/get")
+    assert list(httpr._default_clients.values()) == [shared]
+    assert httpr._get_default_client() is shared
+    assert httpr._get_default_client(verify=False) is not shared
+
+
+def test_default_client_scopes_cookies_to_calls(base_url):
+    # /cookies/set sets the cookie on a redirect to /cookies.
+    response = httpr.get(f"{base_url}/cookies/set?k=v")
+    assert response.json()["cookies"] == {"k": "v"}
+    assert httpr.get(f"{base_url}/cookies").json()["cookies"] == {}
+
+
+def test_default_client_follows_proxy_env(monkeypatch):
+    monkeypatch.setattr(httpr, "_default_clients", {})
+    shared = httpr._get_default_client()
+    monkeypatch.setenv("HTTPR_PROXY", "http://127.0.0.1:8080")
+    assert httpr._get_default_client() is not shared
+    monkeypatch.delenv("HTTPR_PROXY")
+    assert httpr._get_default_client() is shared